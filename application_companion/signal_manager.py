@@ -12,6 +12,8 @@
 #       Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
 import multiprocessing
+import os
+import threading
 import time
 
 
@@ -34,6 +36,12 @@ class SignalManager:
         self.__kill_event = multiprocessing.Event()
         self.__alarm_event = multiprocessing.Event()
         self.__grace_period = grace_period
+        # pipe which becomes readable once a stop or kill signal is received,
+        # so that waiting for I/O could also wait for the signals
+        # NOTE it is created only when it is needed, see wakeup_fd
+        self.__wakeup_read_fd = None
+        self.__wakeup_write_fd = None
+        self.__wakeup_lock = threading.Lock()
 
     @property
     def kill_event(self): return self.__kill_event
@@ -44,8 +52,38 @@ class SignalManager:
     @property
     def alarm_event(self): return self.__alarm_event
 
+    @property
+    def wakeup_fd(self):
+        """
+        returns the read end of the pipe which becomes readable once a stop or
+        kill signal is received. The pipe is created at the first call.
+        """
+        with self.__wakeup_lock:
+            if self.__wakeup_read_fd is None:
+                read_fd, write_fd = os.pipe()
+                os.set_blocking(write_fd, False)
+                self.__wakeup_read_fd = read_fd
+                self.__wakeup_write_fd = write_fd
+                # NOTE the signals could already be received before the pipe
+                # is created
+                if self.__shut_down_event.is_set() or \
+                        self.__kill_event.is_set():
+                    self.__wake_up()
+        return self.__wakeup_read_fd
+
     def reset_alarm(self): self.__alarm_event.clear()
 
+    def __wake_up(self):
+        """wakes up the waits for I/O which also wait for the signals"""
+        if self.__wakeup_write_fd is None:
+            # Case, nobody waits for the signals along with I/O
+            return
+        try:
+            os.write(self.__wakeup_write_fd, b'\0')
+        except BlockingIOError:
+            # Case, the pipe is full i.e. it is already readable
+            pass
+
     def kill_signal_handler(self, *args):
         """
         handler for SIGTERM signal
@@ -53,6 +91,7 @@ class SignalManager:
         # log the unexpected behavior
         self.__logger.critical("Received a direct kill signal, shutting down")
         self.__kill_event.set()
+        self.__wake_up()
 
     def interrupt_signal_handler(self, *args):
         """
@@ -72,6 +111,7 @@ class SignalManager:
         # log the unexpected behavior
         self.__logger.critical(f'Received a stop signal: {grace_full_msg}')
         self.__shut_down_event.set()
+        self.__wake_up()
 
     def alarm_signal_handler(self, *args):
         """
@@ -10,33 +10,159 @@
 # Laboratory: Simulation Laboratory Neuroscience
 #       Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
+import os
+import signal
+import collections
+import logging
 import time
 import pickle
 import base64
 import subprocess
-import inspect
+import shutil
+import importlib.util
+import functools
+import hashlib
+import json
+import contextlib
+import threading
+import selectors
+import concurrent.futures
+import types
 
 from EBRAINS_Launcher.common.utils import proxy_manager_server_utils
 from EBRAINS_Launcher.common.utils import networking_utils
 from EBRAINS_Launcher.common.utils import deployment_settings_hpc
 from EBRAINS_Launcher.common.utils import multiprocess_utils
-# from EBRAINS_Launcher.servers.app_server import app as APP_SERVER
-import EBRAINS_Launcher.servers.app_server as APP_SERVER
 
 from EBRAINS_ConfigManager.workflow_configurations_manager.xml_parsers.xml_tags \
     import CO_SIM_XML_CO_SIM_SERVICES_DEPLOYMENT_SRUN_OPTIONS, \
     CO_SIM_XML_CO_SIM_SERVICES_DEPLOYMENT_SETTINGS
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
-import EBRAINS_RichEndpoint.application_companion.application_companion as ApplicationCompanion
-from EBRAINS_RichEndpoint.orchestrator.proxy_manager_server import ProxyManagerServer
-import EBRAINS_RichEndpoint.orchestrator.command_control_service as CommandControlService
-import EBRAINS_RichEndpoint.orchestrator.orchestrator as Orchestrator
 from EBRAINS_RichEndpoint.application_companion.common_enums import SERVICE_COMPONENT_CATEGORY
-import EBRAINS_RichEndpoint.steering.steering_service as SteeringService
 from EBRAINS_RichEndpoint.orchestrator.proxy_manager_client import ProxyManagerClient
 
 from EBRAINS_ConfigManager.workflow_configurations_manager.xml_parsers import constants
 
+# modules of the services to be deployed
+# NOTE the services run in their own processes, so only the paths to their
+# scripts are needed here and the modules themselves are not imported
+_PROXY_MANAGER_SERVER_MODULE = 'EBRAINS_RichEndpoint.orchestrator.proxy_manager_server'
+_CC_MODULE = 'EBRAINS_RichEndpoint.orchestrator.command_control_service'
+_APPCO_MODULE = 'EBRAINS_RichEndpoint.application_companion.application_companion'
+_ORCHESTRATOR_MODULE = 'EBRAINS_RichEndpoint.orchestrator.orchestrator'
+_STEERING_MODULE = 'EBRAINS_RichEndpoint.steering.steering_service'
+_APP_SERVER_MODULE = 'EBRAINS_Launcher.servers.app_server'
+
+
+# default maximum time in seconds to wait for Proxy Manager Server to accept
+# the connections
+# NOTE it includes the time needed by srun to start the server on its node
+_PROXY_MANAGER_SERVER_STARTUP_TIMEOUT = 60
+
+# default maximum time in seconds to wait for all services to be launched and
+# registered with registry
+# NOTE it includes the time needed by srun to start the services on their
+# nodes, but not the time App Server waits for the script to be submitted
+_LAUNCH_TIMEOUT = 600
+
+# default maximum time in seconds to wait for the rest of the services to
+# finish once a service exits with an error
+_SHUTDOWN_TIMEOUT = 60
+
+
+# time in seconds given to a process to terminate before it is killed
+_TERMINATE_GRACE_PERIOD = 2
+
+# number of the last lines of the error stream of a component which are logged
+# again at ERROR level if it exits with an error
+_LOGGED_ERROR_LINES = 20
+
+
+@functools.lru_cache(maxsize=None)
+def _service_file(service_module):
+    """returns the path to the script of the given service module"""
+    return importlib.util.find_spec(service_module).origin
+
+
+def _b64encode_and_pickle(obj):
+    """
+    pickles the object with the highest protocol and encodes it with base64
+    to be passed as a command line argument to the services
+    """
+    return base64.b64encode(
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)).decode('ascii')
+
+
+# serialized booleans passed to the services
+_SERIALIZED_TRUE = _b64encode_and_pickle(True)
+_SERIALIZED_FALSE = _b64encode_and_pickle(False)
+
+
+def _serialized_bool(value):
+    """returns the pre-serialized form of the given boolean"""
+    return _SERIALIZED_TRUE if value else _SERIALIZED_FALSE
+
+
+# placeholder for the serialized action in the command to launch the
+# Application Companions
+# NOTE it can not clash with the serialized arguments, since base64 encoded
+# strings do not contain braces
+_SERIALIZED_ACTION_PLACEHOLDER = '{serialized_action}'
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(executable):
+    """returns the absolute path to the given executable"""
+    return shutil.which(executable) or executable
+
+
+def _spawn(command, **kwargs):
+    """
+    starts the command as a new process.
+
+    NOTE the executable is passed with its absolute path and the file
+    descriptors are not closed explicitly, so that the process could be
+    spawned with posix_spawn rather than fork and exec. The file descriptors
+    opened by Python are non-inheritable anyway. If a process group is given,
+    the process is spawned with vfork and exec instead.
+    """
+    return subprocess.Popen([_resolve_executable(command[0]), *command[1:]],
+                            close_fds=False, shell=False, **kwargs)
+
+
+def _returncode(process):
+    """
+    returns the return code of the process if it is finished, otherwise None.
+
+    NOTE unlike Popen.poll, the finished process is not reaped, so that it is
+    still reaped by the one waiting for it.
+    """
+    if process.returncode is not None:
+        return process.returncode
+    try:
+        result = os.waitid(os.P_PID, process.pid,
+                           os.WEXITED | os.WNOHANG | os.WNOWAIT)
+    except ChildProcessError:
+        # Case, the process is reaped meanwhile
+        return process.returncode
+    if result is None:
+        # Case, the process is still running
+        return None
+    if result.si_code == os.CLD_EXITED:
+        return result.si_status
+    # Case, the process is terminated by a signal
+    return -result.si_status
+
+
+def _drain(fd):
+    """reads and discards the data from the given file descriptor until EOF"""
+    try:
+        while os.read(fd, 4096):
+            pass
+    except OSError:
+        # Case, the pipe is already closed
+        pass
+
 
 class LauncherHPC:
     '''
@@ -50,7 +176,10 @@ class LauncherHPC:
                  is_execution_environment_hpc=False,
                  is_interactive=False,
                  is_monitoring_enabled=False,
-                 is_app_server_enabled=False):
+                 is_app_server_enabled=False,
+                 shutdown_timeout=_SHUTDOWN_TIMEOUT,
+                 launch_timeout=_LAUNCH_TIMEOUT,
+                 proxy_manager_server_startup_timeout=_PROXY_MANAGER_SERVER_STARTUP_TIMEOUT):
 
         self._log_settings = log_settings
         self._configurations_manager = configurations_manager
@@ -65,8 +194,8 @@ class LauncherHPC:
         # set Proxy Manager Server connection details
         self.__proxy_manager_connection_details = {}
         self.__set_up_proxy_manager_connection_details(proxy_manager_server_address)
-        self.__logger.debug("proxy_manager_server_address: "
-                            f"{self.__proxy_manager_connection_details}")
+        self.__logger.debug("proxy_manager_server_address: %s",
+                            self.__proxy_manager_connection_details)
 
         # client to Proxy Manager Server
         self._proxy_manager_client = None
@@ -79,6 +208,36 @@ class LauncherHPC:
         # flag whether the app server is should be launched
         self.__is_app_server_enabled = is_app_server_enabled
         self.__app_server = None
+        # teardowns of the launched components to be called in reverse order
+        # if something goes wrong while launching
+        self.__teardown = contextlib.ExitStack()
+        # launched components to be terminated if something goes wrong while
+        # launching
+        self.__launched_components = []
+        # process group of the launched components which do not interact with
+        # the user, so that they could be signaled at once
+        self.__launched_components_pgid = None
+        self.__launched_components_in_group = []
+        self.__process_group_lock = threading.Lock()
+        # selector to read the outputs of all launched components in a single
+        # background thread, mapping the pipes to the components
+        self.__output_selector = None
+        self.__output_reader = None
+        self.__is_output_reader_running = False
+        self.__output_lock = threading.Lock()
+        # time in seconds given to the rest of the services to finish once a
+        # service exits abnormally i.e. with a non-zero return code, None to
+        # wait without limit
+        # NOTE the services which finish normally do not start it
+        self.__shutdown_timeout = shutdown_timeout
+        # time in seconds given to all services to be launched and registered,
+        # None to wait without limit
+        self.__launch_timeout = launch_timeout
+        self.__launch_deadline = None
+        # time in seconds given to Proxy Manager Server to accept the
+        # connections once it is launched, None to wait without limit
+        self.__proxy_manager_server_startup_timeout = \
+            proxy_manager_server_startup_timeout
         # flag whether the steering is interactive
         self.__is_interactive = is_interactive
         # flag to determine whether resource usage monitroing is enabled
@@ -120,47 +279,68 @@ class LauncherHPC:
         self.__serialized_port_range_for_orchestrator = None
         # Flag to indicate if communication is vua 0MQs
         self.__serialized_is_communicate_via_zmqs = None
-        self.__serialized_action = None
         self.__serialized_is_interactive = None
         self.__serialized_is_monitoring_enabled = None
+        # cache of serialized actions keyed by the digest of their pickled
+        # form, so that identical actions are base64 encoded only once
+        # NOTE every action is still pickled to compute its digest
+        self.__action_blob_cache = {}
 
-        # initialize deployment settings for components
-        if self.__is_execution_environment_hpc:
-            self.__cosim_slurm_nodes_mapping = None
-            self.__srun_command_for_cosim = None
-            self.__ms_components_deployment_settings = None
-            self.__init_deployment_settings(services_deployment_dict)
+        # deployment settings for components
+        # NOTE they are initialized lazily when the components are deployed
+        # on HPC systems
+        self.__services_deployment_dict = services_deployment_dict
 
         self.__logger.debug("initialized.")
 
-    def __init_deployment_settings(self, services_deployment_dict):
-        """helper function to initialize deployment settings for components"""
-
-        if services_deployment_dict is None:
+    @functools.cached_property
+    def __cosim_slurm_nodes_mapping(self):
+        """mapping of the CO_SIM_SLURM_NODE_NNN variables to HPC node names"""
+        if self.__services_deployment_dict is None:
+            # Case a, initialize with settings defined in
+            # deployment_settings_hpc.py script located in common/utils
+            return deployment_settings_hpc.cosim_slurm_nodes_mapping(
+                self.__logger)
+
+        # Case b, initialize with settings defined in XML configurations
+        # __original__: self.__cosim_slurm_nodes_mapping = services_deployment_dict.cosim_slurm_nodes_mapping()
+        # __to_be_removed __:
+        # self.__cosim_slurm_nodes_mapping = deployment_settings_hpc.cosim_slurm_nodes_mapping(self.__logger)
+        return None
+
+    @functools.cached_property
+    def __srun_command_for_cosim(self):
+        """srun options to deploy the components"""
+        if self.__services_deployment_dict is None:
+            # Case a, initialize with settings defined in
+            # deployment_settings_hpc.py script located in common/utils
+            self.__logger.debug("initialized the srun options from utils")
+            return deployment_settings_hpc.default_srun_command.copy()
+
+        # Case b, initialize with settings defined in XML configurations
+        # __original__: self.__srun_command_for_cosim = services_deployment_dict.default_srun_command.copy()
+        self.__logger.debug("initialized the srun options from XML")
+        return self.__services_deployment_dict[
+            CO_SIM_XML_CO_SIM_SERVICES_DEPLOYMENT_SRUN_OPTIONS]
+
+    @functools.cached_property
+    def __ms_components_deployment_settings(self):
+        """Co-Sim components HPC nodes arrangement"""
+        if self.__services_deployment_dict is None:
             # Case a, initialize with settings defined in
             # deployment_settings_hpc.py script located in common/utils
-            self.__cosim_slurm_nodes_mapping = deployment_settings_hpc.cosim_slurm_nodes_mapping(self.__logger)
-            self.__srun_command_for_cosim = deployment_settings_hpc.default_srun_command.copy()
-            self.__ms_components_deployment_settings = deployment_settings_hpc.deployment_settings.copy()
+            # NOTE the settings are only read, so a read-only view is used
+            # rather than a copy
             self.__logger.debug("initialized the deployment settings from utils")
-        else:
-            # Case b, initialize with settings defined in XML configurations
+            return types.MappingProxyType(
+                deployment_settings_hpc.deployment_settings)
 
-            # b.1 - Assigning current HPC node names (e.g. jsc056) to the CO_SIM_SLURM_NODE_NNN variables.
-            # __original__: self.__cosim_slurm_nodes_mapping = services_deployment_dict.cosim_slurm_nodes_mapping()
-            # __to_be_removed __:
-            # self.__cosim_slurm_nodes_mapping = deployment_settings_hpc.cosim_slurm_nodes_mapping(self.__logger)
-
-            # b.2 - srun options
-            # __original__: self.__srun_command_for_cosim = services_deployment_dict.default_srun_command.copy()
-            self.__srun_command_for_cosim = \
-                services_deployment_dict[CO_SIM_XML_CO_SIM_SERVICES_DEPLOYMENT_SRUN_OPTIONS]
-            # b.3 - Co-Sim components HPC nodes arrangement
-            # __original__:
-            # self.__ms_components_deployment_settings = services_deployment_dict.deployment_settings.copy()
-            self.__ms_components_deployment_settings = \
-                services_deployment_dict[CO_SIM_XML_CO_SIM_SERVICES_DEPLOYMENT_SETTINGS]
-            self.__logger.debug("initialized the deployment settings from XML")
+        # Case b, initialize with settings defined in XML configurations
+        # __original__:
+        # self.__ms_components_deployment_settings = services_deployment_dict.deployment_settings.copy()
+        self.__logger.debug("initialized the deployment settings from XML")
+        return self.__services_deployment_dict[
+            CO_SIM_XML_CO_SIM_SERVICES_DEPLOYMENT_SETTINGS]
 
     def __set_up_port_range_for_components(self):
         '''
@@ -185,8 +365,8 @@ class LauncherHPC:
 
         except KeyError:
             # log with traceback
-            self.__logger.exception("error reading Keys from: "
-                                  f"{self.__ports_for_command_control_channel}")
+            self.__logger.exception("error reading Keys from: %s",
+                                    self.__ports_for_command_control_channel)
             # raise to exit
             raise 
 
@@ -206,40 +386,82 @@ class LauncherHPC:
             # Case b, initialize with settings defined in XML configurations
             self.__proxy_manager_connection_details = proxy_manager_server_address
 
-    def __get_proxy_to_registered_component(self, component_service):
+    def __get_proxy_to_registered_component(self, component_service,
+                                            expected_count=1,
+                                            processes=()):
+        '''
+            It checks whether the components are registered with registry.
+            If at least expected_count components of the given category are
+            registered, it returns the proxies to them.
+            Otherwise, if any of the given launched processes exits before or
+            the launch deadline is passed, it returns None.
         '''
-            It checks whether the component is registered with registry.
-            If registered, it returns the proxy to component.
-            Otherwise, it returns None.
+        proxies = self.__get_proxies_to_registered_components(
+            {component_service: expected_count}, processes)
+        if proxies is None:
+            return None
+        return proxies[component_service]
+
+    def __get_proxies_to_registered_components(self, expected_counts,
+                                               processes=()):
         '''
-        proxy = None
-        while not proxy:
-            # fetch proxy if component is already registered
-            proxy = self.__health_registry_manager_proxy.\
-                    find_all_by_category(component_service)
-            if proxy:  # Case, proxy is found
-                self.__logger.debug(f'{component_service.name} is found '
-                                    f'proxy: {proxy}.')
+            It checks with a single query whether the components of all given
+            categories are registered with registry.
+            If at least the expected number of components of each category
+            are registered, it returns the proxies mapped to their categories.
+            Otherwise, if any of the given launched processes exits before or
+            the launch deadline is passed, it returns None.
+        '''
+        categories = ", ".join(category.name for category in expected_counts)
+        proxies = None
+        while not proxies:
+            # fetch proxies if components are already registered
+            # NOTE the registry responds as soon as the components are
+            # registered, or after 0.1 second at the latest
+            proxies = self.__health_registry_manager_proxy.\
+                    wait_for_categories(expected_counts, 0.1)
+            if all(len(proxies[category]) >= expected_count
+                   for category, expected_count in expected_counts.items()):
+                # Case, proxies are found
+                self.__logger.debug('%s are found proxies: %s.',
+                                    categories, proxies)
                 break
-            else:  # Case: proxy is not found yet
-                self.__logger.debug(f"{component_service.name} is not yet "
-                                    "registered, retry in 0.1 second.")
-                time.sleep(0.1)  # do not hog CPU
+            else:  # Case: proxies are not found yet
+                self.__logger.debug("%s are not yet registered, retry.",
+                                    categories)
+                proxies = None
+                exited_processes = [process for process in processes
+                                    if process.poll() is not None]
+                if exited_processes:
+                    # Case, launched process exited without registering
+                    self.__logger.error(
+                        "processes (pids: %s) exited before "
+                        "registering with registry.",
+                        [process.pid for process in exited_processes])
+                    return None
+                if self.__launch_deadline is not None and \
+                        time.monotonic() > self.__launch_deadline:
+                    # Case, launching takes longer than allowed
+                    self.__logger.error("%s are not registered within the "
+                                        "launch timeout of %s seconds.",
+                                        categories, self.__launch_timeout)
+                    return None
                 continue
 
-        # Case, proxy is found
-        return proxy
+        # Case, proxies are found
+        return proxies
 
-    def __log_exception_and_terminate_with_error(self, error_summary):
+    def __log_exception_and_terminate_with_error(self, error_summary, *args):
         """
         Logs the exception with traceback and returns with ERROR as response to
-        terminate with error"""
+        terminate with error. The error summary is formatted lazily with the
+        given arguments."""
         try:
             # raise RuntimeError exception
             raise RuntimeError
         except RuntimeError:
             # log the exception with traceback
-            self.__logger.exception(error_summary)
+            self.__logger.exception(error_summary, *args)
         # respond with Error to terminate
         return Response.ERROR
 
@@ -250,24 +472,17 @@ class LauncherHPC:
         return latency
 
     def __prepare_srun_command(self, service, nodelist, *args, **kwargs):
-        command = []
-        self.__logger.debug(f"preparing command for {service}")
-        self.__logger.debug(f"nodelist: {nodelist}")
+        self.__logger.debug("preparing command for %s", service)
+        self.__logger.debug("nodelist: %s", nodelist)
         if "--nodelist" not in nodelist:
             target_nodelist = self.__cosim_slurm_nodes_mapping[nodelist]
-            command.append(f"--nodelist={target_nodelist}")
-            self.__logger.debug(f"target nodelist={target_nodelist}")
-        else:
-            command.append(nodelist)
-        self.__logger.debug(f"srun command:{command}")
+            nodelist = f"--nodelist={target_nodelist}"
+            self.__logger.debug("target nodelist=%s", target_nodelist)
         # append the service arguments required to instantiate and run it
-        command.append("python3")
-        command.append(f"{service}")
-        for arg in args:
-            command.append(arg)
-        # command.append("&")
-        srun_command_with_args = self.__srun_command_for_cosim + command
-        self.__logger.debug(f"command with arguments:{srun_command_with_args}")
+        srun_command_with_args = [*self.__srun_command_for_cosim, nodelist,
+                                  "python3", f"{service}", *args]
+        self.__logger.debug("command with arguments:%s",
+                            srun_command_with_args)
         return srun_command_with_args
 
     def __read_popen_pipes(self, process, signal_to_continue_cosim):
@@ -285,82 +500,137 @@ class LauncherHPC:
         int
             return code indicating whether the outputs are read
         """
-        stdout_line = None  # to read from output stream
-        stderr_line = None  # to read from error stream
-        # read until the process is running
-        while process.poll() is None:
-            try:
-                # read from the process output stream
-                stdout_line = multiprocess_utils.non_block_read(
-                        self.__logger,
-                        process.stdout)
-                # log the output received from the process
-                if stdout_line:
-                    decoded_lines = stdout_line.strip().decode('utf-8')
-                    self.__logger.debug(
-                        f"process <{process}>, output: {decoded_lines}")
-
-                    # stop reading if the signal to continue the cosim is
-                    # received
-
-                    # NOTE by protocol, Proxy Manager Server prints following
-                    # statement when started:
-                    # "starting Proxy Manager Server at..."
-
-                    # NOTE App Server responded with "POST /submit HTTP/1.1"
-                    # when the script is submitted
-                    
-                    if signal_to_continue_cosim in decoded_lines:
-                        self.__logger.info(f"{decoded_lines}")
-                        break
+        signal_to_continue_cosim = signal_to_continue_cosim.encode('utf-8')
+        # NOTE the signal could be split across two reads, so the end of the
+        # previous read is kept to search for it
+        tail_length = len(signal_to_continue_cosim) - 1
+        tails = {}
+        try:
+            # NOTE the selector blocks until the outputs are available rather
+            # than polling the pipes periodically
+            with selectors.DefaultSelector() as selector:
+                for stream in (process.stdout, process.stderr):
+                    selector.register(stream.fileno(), selectors.EVENT_READ,
+                                      stream is process.stderr)
+                    tails[stream.fileno()] = b''
+                # read until the process is running
+                while process.poll() is None:
+                    for key, _ in selector.select(timeout=1.0):
+                        output = os.read(key.fd, 4096)
+                        if not output:
+                            # Case, the stream is closed
+                            selector.unregister(key.fd)
+                            continue
+
+                        if key.data:
+                            # log the error reported by the process
+                            # NOTE the response from App Server is read from
+                            # error stream
+                            self.__logger.error(
+                                "%s: %s", process,
+                                output.strip().decode('utf-8', 'replace'))
+                        elif self.__logger.isEnabledFor(logging.DEBUG):
+                            # log the output received from the process
+                            self.__logger.debug(
+                                "process <%s>, output: %s", process,
+                                output.strip().decode('utf-8', 'replace'))
+
+                        # stop reading if the signal to continue the cosim is
+                        # received
+                        # NOTE App Server responded with "POST /submit HTTP/1.1"
+                        # when the script is submitted
+                        received = tails[key.fd] + output
+                        if received.find(signal_to_continue_cosim) != -1:
+                            self.__logger.info(
+                                received.strip().decode('utf-8', 'replace'))
+                            return Response.OK
+                        tails[key.fd] = received[-tail_length:] \
+                            if tail_length else b''
+
+        # just in case if process hangs on reading
+        except KeyboardInterrupt:
+            # log the exception with traceback
+            self.__logger.exception("KeyboardInterrupt caught by: "
+                                    "process <%s>", process)
+            # terminate the Popen process peremptory
+            if self.__terminate_launched_component(process) == Response.ERROR:
+                # Case a, process could not be terminated
+                self.__logger.error('could not terminate the process '
+                                    '<%s>', process)
+            else:
+                # Case b, Popen process is terminated safely
+                self.__logger.critical('<%s> is terminated!', process)
+
+            # terminate reading loop with ERROR
+            return Response.ERROR
 
-                # read from the process error stream
-                stderr_line = multiprocess_utils.non_block_read(
-                        self.__logger,
-                        process.stderr)
-                # log the error reported by the process
-                if stderr_line:
-                    self.__logger.error(
-                        f"{process}: "
-                        f"{stderr_line.strip().decode('utf-8')}")
-
-                    decoded_lines = stderr_line.strip().decode('utf-8')
-                    self.__logger.debug(
-                        f"process <{process}>, output: {decoded_lines}")
-
-                    # stop reading
-                    
-                    # NOTE the response from App Server is read from
-                    # error stream
-                    if signal_to_continue_cosim in decoded_lines:
-                        self.__logger.info(f"{decoded_lines}")
-                        break
+        # all went well, the expected outputs are read
+        return Response.OK
+    
+    def __drain_popen_pipes(self, process):
+        """
+        helper function to keep reading and discarding the outputs of the
+        process in background so that it does not block on full pipes.
+        """
+        for stream in (process.stdout, process.stderr):
+            fd = stream.fileno()
+            # NOTE reading blocks the draining thread only
+            os.set_blocking(fd, True)
+            threading.Thread(target=_drain, args=(fd,), daemon=True).start()
 
-                # Otherwise, wait a bit to let the process proceed the execution
-                time.sleep(0.1)
-                # continue reading
-                continue
+    def __wait_for_proxy_manager_server(self, ip, port, key):
+        """
+        helper function to connect with the launched Proxy Manager Server at
+        given IP:Port address as soon as it accepts the connections.
 
-            # just in case if process hangs on reading
-            except KeyboardInterrupt:
-                # log the exception with traceback
-                self.__logger.exception("KeyboardInterrupt caught by: "
-                                        f"process <{process}>")
-                # terminate the Popen process peremptory
-                if self.__terminate_launched_component(process) == Response.ERROR:
-                    # Case a, process could not be terminated
-                    self.__logger.error('could not terminate the process '
-                                        f'<{process}>')
-                else:
-                    # Case b, Popen process is terminated safely
-                    self.__logger.critical(f'<{process}> is terminated!')
+        Parameters
+        ----------
+        ip : string
+            IP address of the server
+
+        port: int
+            port number where server is listening the connection requests
 
-                # terminate reading loop with ERROR
+        key: bytes
+            authorization key
+
+        Returns
+        ------
+        int
+            return code indicating whether the connection is established
+        """
+        deadline = None
+        if self.__proxy_manager_server_startup_timeout is not None:
+            deadline = time.monotonic() + \
+                self.__proxy_manager_server_startup_timeout
+        while deadline is None or time.monotonic() < deadline:
+            # Case a, server process is already terminated
+            if self.__proxy_manager_server.poll() is not None:
+                self.__logger.error("Proxy Manager Server exited with "
+                                    "return code: %s",
+                                    self.__proxy_manager_server.returncode)
                 return Response.ERROR
+            # probe whether the server is accepting the connections
+            # NOTE the probe is an authorized connection, so that the server
+            # does not treat it as a failed handshake
+            if self._proxy_manager_client.try_connect(ip, port, key) == \
+                    Response.ERROR:
+                # Case b, server is not accepting the connections yet, retry
+                # in a bit
+                time.sleep(0.01)  # do not hog CPU
+                continue
+            # NOTE a server of an earlier run could still be holding the
+            # address, so make sure that the launched server did not fail to
+            # bind it and exit meanwhile
+            if self.__proxy_manager_server.poll() is None:
+                # Case c, connected with the launched server
+                return Response.OK
+
+        # Case d, server did not accept the connections in time
+        self.__logger.error("Proxy Manager Server is not accepting the "
+                            "connections at %s:%s", ip, port)
+        return Response.ERROR
 
-        # all went well, the expected outputs are read
-        return Response.OK
-    
     def __setup_runtime(self):
         """
             Sets up essential settings for launching the components.
@@ -384,7 +654,7 @@ class LauncherHPC:
         # prepare command to deploy the Proxy Manager Server
         proxy_manager_server_command = self.__deployment_command(
             # service to be executed
-            ProxyManagerServer,
+            _PROXY_MANAGER_SERVER_MODULE,
             # service category name to fetch the deployment settings
             SERVICE_COMPONENT_CATEGORY.PROXY_MANAGER_SERVER.name,
             # connection details settings for Proxy Manager Server
@@ -392,38 +662,27 @@ class LauncherHPC:
         )
 
         # start Proxy Manager Server process
-        self.__proxy_manager_server = subprocess.Popen(
-                proxy_manager_server_command,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                shell=False)
-
-        # read outputs from Proxy Manager Server process to confirm if it
-        # has already started listening for connections
-        if self.__read_popen_pipes(process=self.__proxy_manager_server,
-                                   signal_to_continue_cosim="starting Proxy Manager Server at") == Response.ERROR or\
-           self.__proxy_manager_server.poll() is not None:
+        self.__proxy_manager_server = _spawn(proxy_manager_server_command)
+
+        # NOTE the connection details are already known to the launcher
+        connection_details = self.__proxy_manager_connection_details
+
+        # 4. Connect with Proxy Manager Server as soon as it accepts the
+        # connections
+        self._proxy_manager_client = ProxyManagerClient(
+            self._log_settings,
+            self._configurations_manager)
+        if self.__wait_for_proxy_manager_server(
+                connection_details["IP"],
+                connection_details["PORT"],
+                connection_details["KEY"]) == Response.ERROR:
             # Case a, server could not be started
             # log the exception with traceback and terminate with error
             return self.__log_exception_and_terminate_with_error(
-                                "Could not read output!")
+                                "Proxy Manager Server could not be started!")
         # Case b, server is started
         self.__logger.info("Proxy Manager Server is started!")
-
-        # 4. Connect with Proxy Manager Server
-        # NOTE: it terminates with RuntimeError if connection could ne be made
-        # for whatever reasons
-        self._proxy_manager_client = ProxyManagerClient(
-            self._log_settings,
-            self._configurations_manager)
-
-        connection_details = pickle.loads(
-            base64.b64decode(self.__serialized_proxy_manager_connection_details))    
-        self._proxy_manager_client.connect(
-            connection_details["IP"],
-            connection_details["PORT"],
-            connection_details["KEY"])
+        self.__teardown.callback(self.__stop_proxy_manager_server)
 
         # 5. get the proxy to registry manager
         self.__health_registry_manager_proxy = \
@@ -432,7 +691,7 @@ class LauncherHPC:
         # all is fine
         return Response.OK
 
-    def __deployment_command(self, service, service_component_name, *args):
+    def __deployment_command(self, service_module, service_component_name, *args):
         """
         helper function to get the command to deploy the service locally or
         on HPC systems.
@@ -445,7 +704,8 @@ class LauncherHPC:
             # logger
             self.__logger,
             self.__is_execution_environment_hpc,
-            inspect.getfile(service),
+            # path to the script of the service to be executed
+            _service_file(service_module),
             # cosim default nodelist for the given service
             default_cosim_nodelist_for_service,
             # target nodelist from srun command defined in xml
@@ -460,55 +720,70 @@ class LauncherHPC:
             by MS components for initializing and setup
         """
         # Log Settings
-        self.__serialized_log_settings = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self._log_settings)
+        self.__serialized_log_settings = _b64encode_and_pickle(
+            self._log_settings)
 
         # Configurations Manager
-        self.__serialized_configurations_manager = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self._configurations_manager)
+        self.__serialized_configurations_manager = _b64encode_and_pickle(
+            self._configurations_manager)
 
         # Connection details of Proxy Manager Server
-        self.__serialized_proxy_manager_connection_details = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__proxy_manager_connection_details)
+        self.__serialized_proxy_manager_connection_details = _b64encode_and_pickle(
+            self.__proxy_manager_connection_details)
 
         # Range of ports for Command & Control Service
-        self.__serialized_port_range_for_command_control = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__port_range_for_command_control)
+        self.__serialized_port_range_for_command_control = _b64encode_and_pickle(
+            self.__port_range_for_command_control)
 
         # Range of ports for Application Companions
-        self.__serialized_port_range_for_application_companions = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__port_range_for_application_companions)
+        self.__serialized_port_range_for_application_companions = _b64encode_and_pickle(
+            self.__port_range_for_application_companions)
 
         # Range of ports for Application Manager
-        self.__serialized_port_range_for_application_manager = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__port_range_for_application_manager)
+        self.__serialized_port_range_for_application_manager = _b64encode_and_pickle(
+            self.__port_range_for_application_manager)
 
         # Range of ports for Orchestrator
-        self.__serialized_port_range_for_orchestrator = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__port_range_for_orchestrator)
+        self.__serialized_port_range_for_orchestrator = _b64encode_and_pickle(
+            self.__port_range_for_orchestrator)
 
         # Boolean to indicate if communication is vua 0MQs
-        self.__serialized_is_communicate_via_zmqs = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, True)
+        self.__serialized_is_communicate_via_zmqs = _SERIALIZED_TRUE
 
         # Boolean to indicate if steering is interactive
-        self.__serialized_is_interactive = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__is_interactive)
+        self.__serialized_is_interactive = _serialized_bool(
+            self.__is_interactive)
         
         # Boolean to indicate if steering is interactive
-        self.__serialized_is_monitoring_enabled = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__is_monitoring_enabled)
+        self.__serialized_is_monitoring_enabled = _serialized_bool(
+            self.__is_monitoring_enabled)
 
         # Boolean to indicate if target platform for deployment is HPC
-        self.__serialized_is_execution_environment_hpc = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, self.__is_execution_environment_hpc)
+        self.__serialized_is_execution_environment_hpc = _serialized_bool(
+            self.__is_execution_environment_hpc)
 
-    def __checkpoint_service_status(self, service):
+    def __serialize_action(self, action):
+        """
+            helper function to encode base64 and pickle the action. The
+            identical actions are base64 encoded only once and then reused
+            from cache.
+        """
+        pickled_action = pickle.dumps(action, protocol=pickle.HIGHEST_PROTOCOL)
+        action_digest = hashlib.blake2b(pickled_action).digest()[:16]
+        serialized_action = self.__action_blob_cache.get(action_digest)
+        if serialized_action is None:
+            # Case, action is not yet encoded
+            serialized_action = base64.b64encode(pickled_action).decode('ascii')
+            self.__action_blob_cache[action_digest] = serialized_action
+        return serialized_action
+
+    def __checkpoint_service_status(self, service, processes=()):
         """
             helper function to check if the service is running and registered
             with Registry Service
         """
-        if self.__get_proxy_to_registered_component(service) is None:
+        if self.__get_proxy_to_registered_component(
+                service, processes=processes) is None:
             # Case a, something went wrong and service is not registered with
             # Registry
             return Response.ERROR
@@ -516,6 +791,281 @@ class LauncherHPC:
             # Case b, all is fine
             return Response.OK
 
+    def __checkpoint_services(self, launched_services, launched_at):
+        """
+            helper function to check with a single registry query if the
+            launched processes of the given services are running and
+            registered with Registry Service.
+
+            It returns the number of expected and registered components and
+            the pids of the exited processes of each broken service, mapped
+            to the name of the service.
+
+            NOTE the components register with the ids of their own processes,
+            which on HPC systems are not the launched srun processes, so only
+            the number of registered components is compared.
+        """
+        processes = [process for service_processes in launched_services.values()
+                     for process in service_processes]
+        if self.__get_proxies_to_registered_components(
+                {service: len(service_processes) for service, service_processes
+                 in launched_services.items()}, processes) is not None:
+            # Case a, all is fine
+            for service, service_processes in launched_services.items():
+                self.__log_checkpoint(service, service_processes, launched_at)
+            return {}
+
+        # Case b, something went wrong with service launching, determine
+        # the shortfall of registered components and the exited processes
+        registered_components = self.__health_registry_manager_proxy.\
+            find_all_by_categories(list(launched_services))
+        broken_services = {}
+        for service, service_processes in launched_services.items():
+            registered = len(registered_components[service])
+            exited_pids = [process.pid for process in service_processes
+                           if process.poll() is not None]
+            if registered < len(service_processes) or exited_pids:
+                broken_services[service.name] = {
+                    "expected": len(service_processes),
+                    "registered": registered,
+                    "exited (pids)": exited_pids}
+        return broken_services
+
+    def __log_checkpoint(self, service, processes, launched_at):
+        """
+            helper function to log a single structured record when the
+            launched processes of the service are deployed successfully
+        """
+        if self.__logger.isEnabledFor(logging.INFO):
+            self.__logger.info("Checkpoint: %s", json.dumps({
+                "phase": service.name,
+                "components": [process.pid for process in processes],
+                "t_start": launched_at,
+                "t_ready": time.time()}))
+
+    def __spawn_component(self, command, component_name,
+                          is_interactive=False, **kwargs):
+        """
+            helper function to launch the component. Unless the output streams
+            are given, the outputs of the component are logged with its name
+            and pid as prefix. The last errors are logged again at ERROR level
+            if it exits with an error.
+
+            NOTE an interactive component keeps the standard streams and the
+            process group of the launcher to interact with the user. The
+            others are launched in the process group of the launched
+            components, which is in the background of the terminal, so they
+            must not read from or write to the terminal.
+        """
+        if is_interactive:
+            # Case a, the component interacts with the user via terminal
+            process = _spawn(command, **kwargs)
+            self.__launched_components.append(process)
+            return process
+
+        # Case b, the component does not interact with the user
+        kwargs.setdefault("stdin", subprocess.DEVNULL)
+        is_output_logged = "stdout" not in kwargs
+        if is_output_logged:
+            kwargs.update(stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        process = self.__spawn_in_process_group(command, **kwargs)
+        if is_output_logged:
+            self.__stream_output(process.stdout, component_name, process)
+            self.__stream_output(process.stderr, component_name, process,
+                                 is_error_stream=True)
+        return process
+
+    def __spawn_in_process_group(self, command, **kwargs):
+        """
+            helper function to launch the process in the process group of
+            the launched components
+
+            NOTE a process group exists as long as any of its members does,
+            and the members are only reaped by the launcher, so the group can
+            be joined as long as one of its members is not yet reaped.
+        """
+        with self.__process_group_lock:
+            if not self.__is_any_in_process_group_running():
+                # Case a, no components are launched yet or all of them are
+                # already finished, the process becomes the leader of a new
+                # process group
+                process = _spawn(command, process_group=0, **kwargs)
+                self.__launched_components_pgid = process.pid
+                self.__launched_components.append(process)
+                self.__launched_components_in_group.append(process)
+                return process
+            pgid = self.__launched_components_pgid
+
+        # Case b, join the process group of the launched components
+        process = _spawn(command, process_group=pgid, **kwargs)
+        with self.__process_group_lock:
+            self.__launched_components.append(process)
+            self.__launched_components_in_group.append(process)
+        return process
+
+    def __is_any_in_process_group_running(self):
+        """
+            returns whether any of the launched components in the process
+            group is not yet reaped
+        """
+        return any(process.poll() is None
+                   for process in self.__launched_components_in_group)
+
+    def __signal_launched_components(self, signal_number):
+        """
+            sends the signal at once to all launched components in the process
+            group, if any of them is still running
+        """
+        with self.__process_group_lock:
+            if not self.__is_any_in_process_group_running():
+                # Case a, all components are already finished
+                return
+            # Case b, signal the process group
+            # NOTE the process group can not be gone meanwhile, since the
+            # running component is not yet reaped
+            os.killpg(self.__launched_components_pgid, signal_number)
+
+    def __stream_output(self, stream, component_name, process,
+                        is_error_stream=False):
+        """
+            helper function to log the outputs read from the given pipe in the
+            background thread serving the outputs of all launched components.
+            The last lines of the error stream are kept to be logged again if
+            the component exits with an error.
+
+            NOTE the outputs are logged at INFO level, since the components
+            also write their regular logs to the error stream
+        """
+        error_lines = collections.deque(maxlen=_LOGGED_ERROR_LINES) \
+            if is_error_stream else None
+        os.set_blocking(stream.fileno(), False)
+        with self.__output_lock:
+            if self.__output_selector is None:
+                self.__output_selector = selectors.DefaultSelector()
+            self.__output_selector.register(
+                stream, selectors.EVENT_READ,
+                [component_name, process, error_lines, b""])
+            if not self.__is_output_reader_running:
+                # Case, no reader thread is running, start it
+                # NOTE it stops once all the pipes registered so far are
+                # closed
+                self.__is_output_reader_running = True
+                self.__output_reader = threading.Thread(
+                    target=self.__log_outputs, daemon=True)
+                self.__output_reader.start()
+
+    def __log_outputs(self):
+        """
+            reads the outputs of the launched components and logs them line
+            by line with the names and pids of the components as prefix
+        """
+        # components which closed their error streams, to be checked whether
+        # they exit with an error
+        closed_components = []
+        while True:
+            with self.__output_lock:
+                if not self.__output_selector.get_map() and \
+                        not closed_components:
+                    # Case a, all pipes are closed
+                    self.__is_output_reader_running = False
+                    return
+            closed_components = [
+                closed_component for closed_component in closed_components
+                if not self.__log_errors_on_exit(*closed_component)]
+            # NOTE the timeout is to pick up the pipes registered meanwhile on
+            # the platforms where the selector does not do it by itself, and
+            # to check the exits of the components which closed their error
+            # streams
+            timeout = 0.1 if closed_components else 1
+            for key, _ in self.__output_selector.select(timeout=timeout):
+                component_name, process, error_lines, pending = key.data
+                try:
+                    data = os.read(key.fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not data:
+                    # Case b, the component closed its output
+                    lines = [pending] if pending else []
+                    with self.__output_lock:
+                        self.__output_selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    if error_lines is not None:
+                        closed_components.append(
+                            (component_name, process, error_lines))
+                else:
+                    # Case c, log the complete lines and keep the rest
+                    *lines, key.data[3] = (pending + data).split(b"\n")
+                for line in lines:
+                    line = line.decode(errors="replace")
+                    self.__logger.info("%s (pid: %s): %s", component_name,
+                                       process.pid, line)
+                    if error_lines is not None:
+                        error_lines.append(line)
+
+    def __log_errors_on_exit(self, component_name, process, error_lines):
+        """
+            helper function to log the last lines of the error stream of the
+            component at ERROR level if it exited with an error.
+
+            Returns whether the component is finished.
+        """
+        returncode = _returncode(process)
+        if returncode is None:
+            # Case a, the component is still running
+            return False
+        if returncode != 0 and error_lines:
+            # Case b, the component exited with an error
+            self.__logger.error("%s (pid: %s) exited with return code %s, "
+                                "last errors:\n%s", component_name,
+                                process.pid, returncode,
+                                "\n".join(error_lines))
+        # Case c, the component is finished
+        return True
+
+    def __join_output_reader(self):
+        """
+            helper function to wait until the remaining outputs of the
+            finished components are logged
+        """
+        if self.__output_reader is not None:
+            self.__output_reader.join(timeout=_TERMINATE_GRACE_PERIOD)
+
+    def __terminate_launched_components(self):
+        """
+            terminates all launched components, the ones which do not
+            terminate within the grace period are killed.
+
+            NOTE the components in the process group are signaled at once,
+            only the interactive one is signaled on its own. A session per
+            component would need a signal per component again.
+        """
+        # signal all components first so that they terminate concurrently
+        self.__signal_launched_components(signal.SIGTERM)
+        for process in self.__launched_components:
+            if process not in self.__launched_components_in_group and \
+                    process.poll() is None:
+                process.terminate()
+        deadline = time.monotonic() + _TERMINATE_GRACE_PERIOD
+        unterminated_components = []
+        for process in self.__launched_components:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                unterminated_components.append(process)
+        if unterminated_components:
+            # Case, some components did not terminate in time, kill them
+            self.__logger.warning("components (pids: %s) did not terminate "
+                                  "within %s seconds, sending SIGKILL",
+                                  [process.pid for process in
+                                   unterminated_components],
+                                  _TERMINATE_GRACE_PERIOD)
+            self.__signal_launched_components(signal.SIGKILL)
+            for process in unterminated_components:
+                if process not in self.__launched_components_in_group:
+                    process.kill()
+                process.wait()
+        self.__join_output_reader()
+
     def __terminate_launched_component(self, component):
         """terminates the launched subprocess"""
         return multiprocess_utils.stop_preemptory(self.__logger, component)
@@ -532,10 +1082,13 @@ class LauncherHPC:
         # to wait until all interscalehubs register their connection endpoints
         # in registry service.
 
-        self.__logger.debug(f"Number of Actions to be launched{len(actions)}")
+        self.__logger.debug("Number of Actions to be launched: %d", len(actions))
         interscaelhub_endpoints = 0
+        is_debug_enabled = self.__logger.isEnabledFor(logging.DEBUG)
         for action in actions:
-            self.__logger.debug(f"action: {action}, action-goal: {action.get('action-goal')}")
+            if is_debug_enabled:
+                self.__logger.debug("action: %s, action-goal: %s",
+                                    action, action.get('action-goal'))
 
             # NOTE Application Companion waits until it receives the endpoints from all
             # InterscaleHubs
@@ -561,28 +1114,156 @@ class LauncherHPC:
                 # TODO ref to aforementioned TODO
                 interscaelhub_endpoints += 1
 
-        self.__logger.debug(f"total_interscaleHub_num_processes: {interscaelhub_endpoints}")
+        self.__logger.debug("total_interscaleHub_num_processes: %d",
+                            interscaelhub_endpoints)
 
         return interscaelhub_endpoints
     
-    def __terminate_after_service_went_wrong(self, service):
+    def __terminate_after_service_went_wrong(self, error_summary, *args):
         '''helper funciton to terminate loudly when something wrong'''
-        # shutdown proxy manager server
-        self.__stop_proxy_manager_server()
-        # terminate Command&Control service
-        self.__terminate_launched_component(service)
+        # terminate the launched components in reverse order of launching
+        # and shutdown proxy manager server
+        self.__teardown.close()
         # log exception with traceback and terminate with error
-        self.__log_exception_and_terminate_with_error(
-            f'{service} is broken!')
+        return self.__log_exception_and_terminate_with_error(error_summary,
+                                                             *args)
    
+    def __wait_for_processes(self, processes):
+        """
+        helper function to wait until all given processes are finished. The
+        processes are reaped in the order they exit.
+
+        Once a process exits abnormally, the rest are given the shutdown
+        timeout to finish as well, otherwise they are stopped forcefully.
+
+        Parameters
+        ----------
+        processes : dict
+            processes to wait for, mapped to their component names
+        """
+        deadline = None
+        if not hasattr(os, "pidfd_open"):
+            # Case a, pidfd is not supported, wait for each in its own thread
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(processes)) as executor:
+                futures = {executor.submit(process.wait): process
+                           for process in processes}
+                not_done = set(futures)
+                while not_done:
+                    timeout = None if deadline is None else \
+                        max(0, deadline - time.monotonic())
+                    done, not_done = concurrent.futures.wait(
+                        not_done, timeout=timeout,
+                        return_when=concurrent.futures.FIRST_COMPLETED)
+                    if not done:
+                        # Case, the shutdown timeout is expired
+                        for future in not_done:
+                            self.__stop_unresponsive_process(
+                                futures[future], processes[futures[future]])
+                        break
+                    for future in done:
+                        deadline = self.__update_shutdown_deadline(
+                            deadline, futures[future],
+                            processes[futures[future]])
+            return
+
+        # Case b, wait for the exit notifications of all processes at once
+        with selectors.DefaultSelector() as selector:
+            for process in processes:
+                if process.poll() is not None:
+                    # Case, process is already finished
+                    deadline = self.__update_shutdown_deadline(
+                        deadline, process, processes[process])
+                    continue
+                selector.register(os.pidfd_open(process.pid),
+                                  selectors.EVENT_READ, process)
+            while selector.get_map():
+                timeout = None if deadline is None else \
+                    max(0, deadline - time.monotonic())
+                events = selector.select(timeout)
+                if not events:
+                    # Case, the shutdown timeout is expired
+                    for key in list(selector.get_map().values()):
+                        selector.unregister(key.fileobj)
+                        os.close(key.fileobj)
+                        self.__stop_unresponsive_process(
+                            key.data, processes[key.data])
+                    break
+                for key, _ in events:
+                    # pidfd is readable, the process is finished
+                    selector.unregister(key.fileobj)
+                    os.close(key.fileobj)
+                    key.data.wait()
+                    deadline = self.__update_shutdown_deadline(
+                        deadline, key.data, processes[key.data])
+
+    def __update_shutdown_deadline(self, deadline, process, component_name):
+        """
+        helper function to start the shutdown timeout once the finished
+        process exited abnormally i.e. with a non-zero return code. The
+        processes which finish normally, e.g. an Application Companion which
+        is done earlier than the others, do not start it.
+
+        Returns the deadline for the rest of the processes to finish, None to
+        wait without limit.
+        """
+        self.__logger.debug("%s is terminated", process)
+        if process.returncode == 0:
+            # Case a, process finished normally
+            return deadline
+        # Case b, process exited abnormally
+        self.__logger.error("%s (pid: %s) exited with return code: %s",
+                            component_name, process.pid, process.returncode)
+        if deadline is None and self.__shutdown_timeout is not None:
+            # start the shutdown timeout for the rest of the processes
+            deadline = time.monotonic() + self.__shutdown_timeout
+        return deadline
+
+    def __wait_for_process(self, process, component_name):
+        """
+        helper function to wait until the process is finished. The process is
+        stopped forcefully if it does not finish within the shutdown timeout.
+        """
+        try:
+            process.wait(timeout=self.__shutdown_timeout)
+            self.__logger.debug("%s is terminated", process)
+        except subprocess.TimeoutExpired:
+            self.__stop_unresponsive_process(process, component_name)
+
+    def __stop_unresponsive_process(self, process, component_name):
+        """
+        helper function to stop the process which did not finish in time,
+        first with SIGTERM and then with SIGKILL.
+        """
+        self.__logger.warning("%s (pid: %s) did not finish within %s seconds, "
+                              "sending SIGTERM", component_name, process.pid,
+                              self.__shutdown_timeout)
+        self.__terminate_and_reap(process, component_name)
+
+    def __terminate_and_reap(self, process, component_name):
+        """
+        helper function to terminate the process, escalating to SIGKILL if it
+        does not terminate within the grace period.
+        """
+        process.terminate()
+        try:
+            process.wait(timeout=_TERMINATE_GRACE_PERIOD)
+        except subprocess.TimeoutExpired:
+            self.__logger.warning("%s (pid: %s) did not terminate within %s "
+                                  "seconds, sending SIGKILL", component_name,
+                                  process.pid, _TERMINATE_GRACE_PERIOD)
+            process.kill()
+            process.wait()
+        self.__logger.debug("%s is terminated", process)
+
     def __setup_app_server(self):
         """starts App Server"""
         port = self.__port_range_for_app_server["MIN"]
         # host = networking_utils.my_ip()
         host = "0.0.0.0"  # NOTE localhost or 127.0.0.1 is not working
-        self.__logger.debug(f"host: {host}, port: {port}")
+        self.__logger.debug("host: %s, port: %s", host, port)
         command_to_run_app_server = self.__deployment_command(
-                APP_SERVER,
+                _APP_SERVER_MODULE,
                 SERVICE_COMPONENT_CATEGORY.APP_SERVER.name,
                 host,
                 str(port),
@@ -590,12 +1271,12 @@ class LauncherHPC:
                 self.__serialized_log_settings,
                 self.__serialized_configurations_manager)
 
-        self.__app_server = subprocess.Popen(
+        self.__app_server = self.__spawn_component(
             command_to_run_app_server,
-            stdin=subprocess.PIPE,
+            SERVICE_COMPONENT_CATEGORY.APP_SERVER.name,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            shell=False)
+            stderr=subprocess.PIPE)
 
         if self.__app_server.poll() is not None:
             # something went wrong during the server launching
@@ -603,7 +1284,7 @@ class LauncherHPC:
             return Response.ERROR
 
         # Case b, all is well
-        self.__logger.info(f"App server is running at {host}:{port}")
+        self.__logger.info("App server is running at %s:%s", host, port)
         return Response.OK
 
     def launch(self, actions):
@@ -611,19 +1292,34 @@ class LauncherHPC:
             launches all the necessary MS components such as Command & Control
             Service, Application Companions, Orchestrator, Steering Service.
         '''
-        self.__logger.debug(f"actions to be launched: {actions}")
+        try:
+            return self.__launch(actions)
+        except KeyboardInterrupt:
+            # NOTE the launched components are in the background process
+            # group, so they do not receive the interrupt from the terminal
+            self.__signal_launched_components(signal.SIGINT)
+            raise
+
+    def __launch(self, actions):
+        '''launches the components and waits until they are finished'''
+        self.__logger.debug("actions to be launched: %s", actions)
         # 1. setup runtime settings
         self.__setup_runtime()
+        # NOTE the launched components are terminated before Proxy Manager
+        # Server is stopped if something goes wrong while launching
+        self.__teardown.callback(self.__terminate_launched_components)
 
         # 2. Launch Modular Science Services
         #####################################
         # i. Launch App Server #
         #####################################
         if self.__is_app_server_enabled:
+            launched_at = time.time()
             if self.__setup_app_server() == Response.ERROR:
                 #  Case a, something went wrong with service launching
                 # shut down Proxy Manager Server and terminate loudly
-                return self.__terminate_after_service_went_wrong(self.__app_server)
+                return self.__terminate_after_service_went_wrong(
+                    '%s is broken!', SERVICE_COMPONENT_CATEGORY.APP_SERVER.name)
             
             # wait until app server receives the script and saves it to
             # userland/models directory
@@ -631,153 +1327,137 @@ class LauncherHPC:
                                        signal_to_continue_cosim="POST /submit") == Response.ERROR:
                 # Case a, an error occured when reading from the pipes
                 # log the exception with traceback and terminate with error
-                self.__terminate_after_service_went_wrong(self.__app_server)
-                return self.__log_exception_and_terminate_with_error(
+                return self.__terminate_after_service_went_wrong(
                     "Could not read output!")
 
             # Case b, the script is submitted
-            self.__logger.info("script is submitted by App Server!")
+            # NOTE the outputs of App Server are no longer needed, but the
+            # pipes must still be drained so that it does not block on writing
+            self.__drain_popen_pipes(self.__app_server)
 
-        # Case b, all is fine continue with launching
-        self.__logger.info('Checkpoint: App Server is deployed successfully!')
+            # Case b, all is fine continue with launching
+            self.__log_checkpoint(SERVICE_COMPONENT_CATEGORY.APP_SERVER,
+                                  [self.__app_server], launched_at)
     # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
+        # NOTE the launch timeout starts after App Server, since it waits for
+        # the script to be submitted by the user
+        if self.__launch_timeout is not None:
+            self.__launch_deadline = time.monotonic() + self.__launch_timeout
         #####################################
         # i. Launch Command&Control service #
         #####################################
-        self.__logger.info('setting up Command and Control service.')
+        cc_launched_at = time.time()
         command_to_run_cc_service = self.__deployment_command(
-                CommandControlService,
+                _CC_MODULE,
                 SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL.name,
                 self.__serialized_log_settings,
                 self.__serialized_configurations_manager,
                 self.__serialized_proxy_manager_connection_details,
                 self.__serialized_port_range_for_command_control)
-        cc_service = subprocess.Popen(command_to_run_cc_service, shell=False)
-
-        ###############
-        # Checkpoint 1: Command&Control service is running and status is ready
-        ###############
-        # Case a, something went wrong with service launching
-        if self.__checkpoint_service_status(
-                SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL) == Response.ERROR:
-            # shut down Proxy Manager Server and terminate loudly
-            return self.__terminate_after_service_went_wrong(cc_service)
-
-        # Case b, all is fine continue with launching
-        self.__logger.info('Checkpoint: Command & Control service is '
-                           'deployed successfully and status is ready!')
+        cc_service = self.__spawn_component(
+            command_to_run_cc_service,
+            SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL.name)
+        # NOTE the Application Companions and Orchestrator depend on
+        # Command&Control service, so it is checked right before launching
+        # them, and meanwhile their commands are prepared
     # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
         #####################################
         # ii. Launch Application Companions #
         #####################################
-        application_companions = []
         # number of Application Companions to be launched
-        serialized_total_num_application_companion = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, len(actions))
+        serialized_total_num_application_companion = _b64encode_and_pickle(
+            len(actions))
         # number of InterscaleHub processes to be launched
         total_interscaleHub_num_processes = self.__total_num_interscaelhub_endpoints(actions)
-        self.__logger.debug(f"total_interscaleHub_num_processes: {total_interscaleHub_num_processes}")
         if total_interscaleHub_num_processes < 1:
             # shut down Proxy Manager Server and terminate loudly
-            return self.__terminate_after_service_went_wrong(cc_service)
+            return self.__terminate_after_service_went_wrong(
+                'No InterscaleHub endpoints found in the actions!')
         
         # serialize number of interscaleHub processes
-        serialized_total_interscaleHub_num_processes = multiprocess_utils.b64encode_and_pickle(
-            self.__logger, total_interscaleHub_num_processes)
+        serialized_total_interscaleHub_num_processes = _b64encode_and_pickle(
+            total_interscaleHub_num_processes)
         
-        # launch Application Companions
-        for action in actions:
-            # serialize the action
-            self.__serialized_action = multiprocess_utils.b64encode_and_pickle(
-                self.__logger, action)
-            command_to_run_application_companion = self.__deployment_command(
-                ApplicationCompanion,
-                SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION.name,
-                self.__serialized_log_settings,
-                self.__serialized_configurations_manager,
-                self.__serialized_action,
-                self.__serialized_proxy_manager_connection_details,
-                self.__serialized_port_range_for_application_companions,
-                self.__serialized_port_range_for_application_manager,
-                self.__serialized_is_execution_environment_hpc,
-                serialized_total_num_application_companion,
-                serialized_total_interscaleHub_num_processes,
-                self.__serialized_is_monitoring_enabled
-            )
-            self.__logger.info('setting up Application Companion.')
-            application_companions.append(subprocess.Popen(
-                                        command_to_run_application_companion,
-                                        shell=False))
-        ###############
-        # Checkpoint 2: Application Companions are running and status is ready
-        ###############
-        is_terminated = False
-        is_broken_service = False
-        for application_companion in application_companions:
-            #  Case a, something went wrong with service launching
-            if self.__checkpoint_service_status(
-                    SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION) == Response.ERROR:
-                if not is_terminated:
-                    # shutdown proxy manager server
-                    self.__stop_proxy_manager_server()
-                    # terminate Command&Control service
-                    self.__terminate_launched_component(cc_service)
-                    is_terminated = True
-                    is_broken_service = True
-                #  terminate Application Companion
-                self.__terminate_launched_component(application_companion)
-
-            # log exception with traceback and terminate with error
-            if is_broken_service:
-                return self.__log_exception_and_terminate_with_error(
-                    f'{application_companion} is broken!')
-
-        # Case b, all is fine continue with launching
-        self.__logger.info('Checkpoint: Application Companions are '
-                           'deployed successfully and status is ready!')
+        # commands to launch Application Companions
+        # NOTE the commands differ only in the serialized action, so the
+        # command is built once and the action is filled in for each of them
+        command_to_run_application_companion = self.__deployment_command(
+            _APPCO_MODULE,
+            SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION.name,
+            self.__serialized_log_settings,
+            self.__serialized_configurations_manager,
+            _SERIALIZED_ACTION_PLACEHOLDER,
+            self.__serialized_proxy_manager_connection_details,
+            self.__serialized_port_range_for_application_companions,
+            self.__serialized_port_range_for_application_manager,
+            self.__serialized_is_execution_environment_hpc,
+            serialized_total_num_application_companion,
+            serialized_total_interscaleHub_num_processes,
+            self.__serialized_is_monitoring_enabled
+        )
+        action_index = next(
+            index for index, arg in enumerate(
+                command_to_run_application_companion)
+            if _SERIALIZED_ACTION_PLACEHOLDER in arg)
+        command_prefix = command_to_run_application_companion[:action_index]
+        command_suffix = command_to_run_application_companion[action_index+1:]
+        action_arg = command_to_run_application_companion[action_index]
+        commands_to_run_application_companions = [
+            [*command_prefix,
+             action_arg.replace(_SERIALIZED_ACTION_PLACEHOLDER,
+                                self.__serialize_action(action)),
+             *command_suffix]
+            for action in actions]
     # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
         ############################
         # iii. Launch Orchestrator #
         ############################
-        self.__logger.info('setting up Orchestrator.')
+        # NOTE Orchestrator only depends on Command&Control service, so it is
+        # launched together with Application Companions and its status is
+        # checked concurrently with the status of Application Companions
         command_to_run_orchestrator = self.__deployment_command(
-            Orchestrator,
+            _ORCHESTRATOR_MODULE,
             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR.name,
             self.__serialized_log_settings,
             self.__serialized_configurations_manager,
             self.__serialized_proxy_manager_connection_details,
             self.__serialized_port_range_for_orchestrator
         )
-        orchestrator = subprocess.Popen(command_to_run_orchestrator, shell=False)
         ###############
-        # Checkpoint 3: Orchestrator is running and status is ready
+        # Checkpoint 1: Command&Control service is running and status is ready
         ###############
         # Case a, something went wrong with service launching
         if self.__checkpoint_service_status(
-                SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR) == Response.ERROR:
-            # shutdown proxy manager server
-            self.__stop_proxy_manager_server()
-            # terminate Command&Control service
-            self.__terminate_launched_component(cc_service)
-            # terminate Application Companions
-            for application_companion in application_companions:
-                self.__terminate_launched_component(application_companion)
-            # log exception with traceback and terminate with error
-            return self.__log_exception_and_terminate_with_error(
-                f'{orchestrator} is broken!')
+                SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL,
+                [cc_service]) == Response.ERROR:
+            # shut down Proxy Manager Server and terminate loudly
+            return self.__terminate_after_service_went_wrong(
+                '%s (pid: %s) is broken!',
+                SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL.name,
+                cc_service.pid)
 
         # Case b, all is fine continue with launching
-        self.__logger.info('Checkpoint: Orchestrator is deployed successfully '
-                        'and status is ready!')
-    # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
-        ###############################
-        # iv. Launch Steering Service #
-        ###############################
-        # TODO this POC handles both, interactive and non interactive steering
-        # -> refactor/rename to represent both -> generic steering
-        self.__logger.info('setting up Steering Service.')
+        self.__log_checkpoint(SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL,
+                              [cc_service], cc_launched_at)
+        # launch Application Companions and Orchestrator concurrently
+        launched_at = time.time()
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(commands_to_run_application_companions) + 1
+                ) as executor:
+            orchestrator_spawned = executor.submit(
+                self.__spawn_component,
+                command_to_run_orchestrator,
+                SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR.name)
+            application_companions = list(executor.map(
+                functools.partial(
+                    self.__spawn_component,
+                    component_name=SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION.name),
+                commands_to_run_application_companions))
+            orchestrator = orchestrator_spawned.result()
+        # NOTE the command to launch Steering Service is prepared while the
+        # Application Companions and Orchestrator are starting up
         command_to_run_steering_service = self.__deployment_command(
-            SteeringService,
+            _STEERING_MODULE,
             SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE.name,
             self.__serialized_log_settings,
             self.__serialized_configurations_manager,
@@ -785,66 +1465,84 @@ class LauncherHPC:
             self.__serialized_is_communicate_via_zmqs,
             self.__serialized_is_interactive
         )
-        steering_service = subprocess.Popen(command_to_run_steering_service,
-                                            shell=False)
+        ###############
+        # Checkpoint 2: Application Companions are running and status is ready
+        # Checkpoint 3: Orchestrator is running and status is ready
+        ###############
+        # NOTE both are checked with a single registry query
+        broken_services = self.__checkpoint_services(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION:
+                application_companions,
+             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: [orchestrator]},
+            launched_at)
+        #  Case a, something went wrong with service launching
+        if broken_services:
+            # shut down Proxy Manager Server and terminate loudly
+            return self.__terminate_after_service_went_wrong(
+                'services are broken: %s', broken_services)
+
+        # Case b, all is fine continue with launching
+    # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
+        ###############################
+        # iv. Launch Steering Service #
+        ###############################
+        # TODO this POC handles both, interactive and non interactive steering
+        # -> refactor/rename to represent both -> generic steering
+        launched_at = time.time()
+        steering_service = self.__spawn_component(
+            command_to_run_steering_service,
+            SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE.name,
+            is_interactive=self.__is_interactive)
 
         # Checkpoint 4: Steering Service is running and status is ready
         # Case a, something went wrong with service launching
         if self.__checkpoint_service_status(
-                SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE) == Response.ERROR:
-            # shutdown proxy manager server
-            self.__stop_proxy_manager_server()
-            # terminate Command&Control service
-            self.__terminate_launched_component(cc_service)
-            # terminate Application Companions
-            for application_companion in application_companions:
-                self.__terminate_launched_component(application_companion)
-            # terminate Orchestrator
-            self.__terminate_launched_component(orchestrator)
-            # log exception with traceback and terminate with error
-            return self.__log_exception_and_terminate_with_error(
-                f'{steering_service} is broken!')
+                SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE,
+                [steering_service]) == Response.ERROR:
+            # shut down Proxy Manager Server and terminate loudly
+            return self.__terminate_after_service_went_wrong(
+                '%s (pid: %s) is broken!',
+                SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE.name,
+                steering_service.pid)
 
         # Case b, all is fine continue with launching
-        self.__logger.info('Checkpoint: Steering Service is deployed '
-                        'successfully and status is ready!')
+        self.__log_checkpoint(SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE,
+                              [steering_service], launched_at)
     # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
 
         # All MS components are deployed successfully
         self.__logger.info("All MS components are launched!")
+        # NOTE the components are from now on stopped by the normal shutdown
+        self.__teardown.pop_all()
     # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
 
         # wait until all processes are finished
-
-        # Application Companion
-        for application_companion in application_companions:
-            application_companion.wait()
-            self.__logger.debug(f"{application_companion} is terminated")
-
-        # Command&Control Service
-        cc_service.wait()
-        self.__logger.debug(f"{cc_service} is terminated")
-
-        # Orchestrator
-        orchestrator.wait()
-        self.__logger.debug(f"{orchestrator} is terminated")
-
-        # Steering Service
-        steering_service.wait()
-        self.__logger.debug(f"{steering_service} is terminated")
+        launched_processes = dict.fromkeys(
+            application_companions,
+            SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION.name)
+        launched_processes[cc_service] = \
+            SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL.name
+        launched_processes[orchestrator] = \
+            SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR.name
+        launched_processes[steering_service] = \
+            SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE.name
+        self.__wait_for_processes(launched_processes)
+        # log the last outputs of the services
+        self.__join_output_reader()
 
         # Proxy Manager Server
         # send signal to Proxy Manager Server to stop
         self.__logger.info('Stopping Proxy Manager Server')
         self._proxy_manager_client.stop_server()
-        self.__proxy_manager_server.wait()
-        self.__logger.debug(f"{self.__proxy_manager_server} is terminated")
+        self.__wait_for_process(
+            self.__proxy_manager_server,
+            SERVICE_COMPONENT_CATEGORY.PROXY_MANAGER_SERVER.name)
 
         if self.__is_app_server_enabled:
             # app server
-            self.__logger.info(f"terminating app server...")
-            self.__app_server.terminate()
-            self.__logger.debug(f"{self.__app_server} is terminated")
+            self.__logger.info("terminating app server...")
+            self.__terminate_and_reap(
+                self.__app_server, SERVICE_COMPONENT_CATEGORY.APP_SERVER.name)
 
         self.__logger.info("All MS components are terminated!")
     # -*-*-*-*-*-*-*-*-*-*-*-*-*-*-*--*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-*-#
@@ -13,6 +13,7 @@
 # ------------------------------------------------------------------------------
 import multiprocessing
 import os
+import time
 import zmq
 import sys
 import pickle
@@ -36,6 +37,12 @@ from EBRAINS_RichEndpoint.orchestrator import utils
 from EBRAINS_ConfigManager.global_configurations_manager.xml_parsers.configurations_manager import ConfigurationsManager
 
 
+# maximum number of messages pending in each of the shared queues
+# NOTE the commands and responses are exchanged in lockstep, so only a few of
+# them are pending at a time
+_QUEUE_MAXSIZE = 16
+
+
 class CommandControlService:
     """
     It channels the command and steering between Orchestrator and
@@ -92,10 +99,19 @@ class CommandControlService:
         # assuming that it is to be deployed on laptop/single node
         if ports_for_command_control_channel is None:
             # proxies to the shared queues
+            # NOTE the queues are shared with the other components via the
+            # registry, so they must be proxies rather than multiprocessing
+            # Queues which can only be shared by inheritance. Both queues are
+            # served by a single manager process
+            self.__queue_manager = multiprocessing.Manager()
             # for in-coming messages
-            self.__queue_in = multiprocessing.Manager().Queue()
+            # NOTE the queues are bounded so that a stalled consumer makes the
+            # sender fail instead of piling up messages in the manager
+            self.__queue_in = self.__queue_manager.Queue(
+                maxsize=_QUEUE_MAXSIZE)
             # for out-going messages
-            self.__queue_out = multiprocessing.Manager().Queue()
+            self.__queue_out = self.__queue_manager.Queue(
+                maxsize=_QUEUE_MAXSIZE)
             self.__endpoints_address = (self.__queue_in, self.__queue_out)
             return Response.OK
         else:
@@ -197,17 +213,17 @@ class CommandControlService:
         application_companions = self.__health_registry_manager_proxy.\
             find_all_by_category(
                             SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION)
-        self.__logger.debug(f'found application companions: '
-                            f'{len(application_companions)}')
-        # create a list of application companions input endpoints proxies
-        self.__application_companions_in_queues = []
-        # create a list of application companions output endpoints proxies
-        self.__application_companions_out_queues = []
-        # populate the lists
-        for application_companion in application_companions:
-            in_queue, out_queue = application_companion.endpoint
-            self.__application_companions_in_queues.append(in_queue)
-            self.__application_companions_out_queues.append(out_queue)
+        self.__logger.debug('found application companions: %s',
+                            len(application_companions))
+        # application companions input and output endpoints proxies
+        # NOTE the set of application companions is fixed once they are
+        # registered, so the proxies are kept in tuples
+        endpoints = [application_companion.endpoint
+                     for application_companion in application_companions]
+        self.__application_companions_in_queues = tuple(
+            in_queue for in_queue, _ in endpoints)
+        self.__application_companions_out_queues = tuple(
+            out_queue for _, out_queue in endpoints)
 
         # Case a, proxies to endpoints are not found
         if not self.__application_companions_in_queues or\
@@ -216,8 +232,8 @@ class CommandControlService:
             return Response.ERROR
 
         # Case b, proxies to endpoints are found
-        self.__logger.debug(f'found application companion endpoints: '
-                            f'{len(self.__application_companions_in_queues)}')
+        self.__logger.debug('found application companion endpoints: %s',
+                            len(self.__application_companions_in_queues))
         return Response.OK
 
     def __setup_channel_receive_response_from_app_companion(self):
@@ -225,25 +241,28 @@ class CommandControlService:
         # Companions
         self.__pull_endpoint_with_application_companions =\
             self.__zmq_sockets.create_socket(zmq.PULL)
-        self.__application_companions = self.__health_registry_manager_proxy.\
-            find_all_by_category(
-                            SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION)
-        self.__logger.debug(f'found application companions: '
-                            f'{len( self.__application_companions)}')
-
-        # connect with Application Companions
-        for application_companion in self.__application_companions:
-            # fetch Application Companion endpoint to connect with
-            application_companion_endpoint = application_companion.endpoint[
+        # NOTE the set of application companions is fixed once they are
+        # registered, so they are kept in a tuple
+        self.__application_companions = tuple(
+            self.__health_registry_manager_proxy.find_all_by_category(
+                SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION))
+        self.__logger.debug('found application companions: %s',
+                            len(self.__application_companions))
+
+        # addresses of Application Companions endpoints to connect with
+        addresses = [
+            f"tcp://{endpoint.IP}:{endpoint.port}"
+            for endpoint in (
+                application_companion.endpoint[
                     SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL]
-            # format address string
-            address = ("tcp://"
-                       f"{application_companion_endpoint.IP}:"
-                       f"{application_companion_endpoint.port}")
+                for application_companion in self.__application_companions)]
+        # connect with Application Companions
+        # NOTE connecting does not wait for the connections to be established
+        for address in addresses:
             self.__pull_endpoint_with_application_companions.connect(address)
-            self.__logger.info("C&C channel - connected with "
-                               "Application Companion at "
-                               f"{address} to receive responses")
+        self.__logger.info("C&C channel - connected with "
+                           "Application Companions at %s to receive "
+                           "responses", addresses)
 
         return Response.OK
 
@@ -266,24 +285,21 @@ class CommandControlService:
         collects the responses from Application Companions and send them to
         Orchestrator.
         '''
-        # setup channel with Application Companions to receive responses if it
-        # is not made yet
-        if self.__is_pull_connection_with_application_companion_made is False:
-            self.__setup_channel_receive_response_from_app_companion()
-            # set flag to indicate channel setup with Application Compnions
-            self.__is_pull_connection_with_application_companion_made = True
-        
         # collect responses
-        responses = []  # temporary list for response collection
+        # NOTE the channel with Application Companions to receive the
+        # responses is already set up before broadcasting the first command
         # for application_companion_out_queue in \
         #         self.__application_companions_out_queues:
         #     responses.append(self.__communicator.receive(
         #                     application_companion_out_queue))
-        for _ in self.__application_companions:
-            responses.append(self.__communicator.receive(
-                             self.__pull_endpoint_with_application_companions))                          
+        # NOTE the PULL socket is connected to all Application Companions and
+        # queues their responses as they arrive, so they are drained at once
+        # and it takes only as long as the slowest response
+        responses = self.__communicator.receive_all(
+            self.__pull_endpoint_with_application_companions,
+            len(self.__application_companions))
         # send responses back to orchestrator via zeromq
-        self.__logger.debug(f"received responses: {responses}")
+        self.__logger.debug("received responses: %s", responses)
         return self.__communicator.send(responses,
                                             self.__rep_endpoint_with_orchestrator)
 
@@ -304,7 +320,9 @@ class CommandControlService:
                 self.__rep_endpoint_with_orchestrator)
             control_command, current_steering_command, _ = utils.parse_command(
                 self.__logger, command)
-            self.__logger.debug(f'command received: {current_steering_command.name}')
+            self.__logger.debug('command received: %s',
+                                current_steering_command.name)
+            received_at = time.perf_counter()
 
             # Case, STATE_UPDATE_FATAL event is received
             if current_steering_command == EVENT.STATE_UPDATE_FATAL:
@@ -321,8 +339,20 @@ class CommandControlService:
                     self.__application_companions_in_queues)
 
             # Case, a steering command is received.
+            # setup channel with Application Companions to receive responses
+            # if it is not made yet
+            # NOTE the Application Companions are launched after this service
+            # is registered, so it can not be set up before the first command.
+            # But setting it up before broadcasting lets the connections be
+            # established while Application Companions execute the command
+            if self.__is_pull_connection_with_application_companion_made is False:
+                self.__setup_channel_receive_response_from_app_companion()
+                # set flag to indicate channel setup with Application Compnions
+                self.__is_pull_connection_with_application_companion_made = True
+
             # 2. broadcast the steering command
-            self.__logger.info(f'Broadcasting {current_steering_command.name}')
+            self.__logger.debug('Broadcasting %s',
+                                current_steering_command.name)
             if self.__communicator.broadcast_all(
                     # current_steering_command,
                     command,
@@ -338,7 +368,9 @@ class CommandControlService:
                     'could not broadcast. Quitting!')
 
             # Case b, steering command is broadcasted successfully
-            self.__logger.debug(f'broadcasted command: {current_steering_command.name}')
+            self.__logger.debug('broadcasted command: %s',
+                                current_steering_command.name)
+            broadcasted_at = time.perf_counter()
 
             # 3. collect and send responses to Orchestrator
             self.__logger.debug('collecting response.')
@@ -355,6 +387,15 @@ class CommandControlService:
 
             # Case b, responses are forwarded successfully
             self.__logger.debug('forwarded responses to Orchestrator.')
+            forwarded_at = time.perf_counter()
+            # NOTE a single record summarizes the channelling of the command,
+            # the phases are logged in detail at debug level
+            self.__logger.info(
+                'channelled %s: broadcast %.3f ms, responses %.3f ms, '
+                'total %.3f ms', current_steering_command.name,
+                (broadcasted_at - received_at) * 1000,
+                (forwarded_at - broadcasted_at) * 1000,
+                (forwarded_at - received_at) * 1000)
 
             # 4. Terminate the loop if the broadcasted steering command was
             # END command
@@ -368,15 +409,13 @@ class CommandControlService:
     
     def __log_exception_and_terminate_with_error(self, error_summary):
             """
-            Logs the exception with traceback and returns with Enum ERROR as a
-            response to terminate with error.
+            Logs the error with the stack trace and returns with Enum ERROR as
+            a response to terminate with error.
             """
-            try:
-                # raise RuntimeError exception
-                raise RuntimeError
-            except RuntimeError:
-                # log the exception with traceback
-                self.__logger.exception(error_summary)
+            # log the error with the stack trace
+            # NOTE the stack is logged directly rather than raising and
+            # catching an exception just to log its traceback
+            self.__logger.error(error_summary, stack_info=True)
             # respond with Error to terminate
             return Response.ERROR
     
@@ -12,6 +12,46 @@
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
 import abc
+import os
+import signal
+import threading
+
+from EBRAINS_RichEndpoint.application_companion.signal_manager import SignalManager
+
+
+# signal manager shared by all communicators of the process, mapped to the
+# pid of the process so that a forked child does not share the events of
+# its parent
+_signal_managers = {}
+# lock to create the shared signal manager only once
+_signal_managers_lock = threading.Lock()
+# pids of the processes in which the signal handlers are installed
+_signal_handlers_installed = set()
+
+
+def shared_signal_manager(log_settings, configurations_manager):
+    """
+    returns the signal manager shared by all communicators of the process.
+    Its handlers for SIGINT and SIGTERM are installed once, from the main
+    thread, since signal handlers can only be installed from there.
+    """
+    pid = os.getpid()
+    with _signal_managers_lock:
+        signal_manager = _signal_managers.get(pid)
+        if signal_manager is None:
+            # Case, no communicator is created yet in this process
+            signal_manager = SignalManager(log_settings,
+                                           configurations_manager)
+            _signal_managers[pid] = signal_manager
+        if pid not in _signal_handlers_installed and \
+                threading.current_thread() is threading.main_thread():
+            # Case, signal handlers are not yet installed
+            signal.signal(signal.SIGINT,
+                          signal_manager.interrupt_signal_handler)
+            signal.signal(signal.SIGTERM,
+                          signal_manager.kill_signal_handler)
+            _signal_handlers_installed.add(pid)
+        return signal_manager
 
 
 class CommunicatorBaseClass(metaclass=abc.ABCMeta):
@@ -12,12 +12,23 @@
 #
 # ------------------------------------------------------------------------------
 import queue
-import signal
+import pickle
 
-from EBRAINS_RichEndpoint.application_companion.signal_manager import SignalManager
 from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
 from EBRAINS_RichEndpoint.orchestrator.communicator_base import CommunicatorBaseClass
+from EBRAINS_RichEndpoint.orchestrator.communicator_base import shared_signal_manager
+
+
+# maximum time in seconds to wait for a free slot in a bounded queue before
+# the message is considered as not sent
+_SEND_TIMEOUT = 10
+
+# time in seconds to wait for a message before checking again whether the
+# process is set to quit
+# NOTE the queues are Manager proxies, which offer no file descriptor to wait
+# on together with the quit events, so the wait is kept short instead
+_RECEIVE_TIMEOUT = 1
 
 
 class CommunicatorQueue(CommunicatorBaseClass):
@@ -25,6 +36,9 @@ class CommunicatorQueue(CommunicatorBaseClass):
     Implements the CommunicatorBaseClass for abstracting
     the underlying communication protocol. This class provides wrappers
     for inter process communication using python Queues.
+
+    NOTE the messages are put on the queues in their pickled form, so that a
+    broadcast message is pickled only once for all the queues.
     '''
     def __init__(self, log_settings, configurations_manager) -> None:
         self._log_settings = log_settings
@@ -32,14 +46,10 @@ class CommunicatorQueue(CommunicatorBaseClass):
         self.__logger = self._configurations_manager.load_log_configurations(
                                         name=__name__,
                                         log_configurations=self._log_settings)
-        self.__signal_manager = SignalManager(
+        # NOTE the signal manager and its handlers are shared by all
+        # communicators of the process
+        self.__signal_manager = shared_signal_manager(
                                         self._log_settings, self._configurations_manager)
-        signal.signal(signal.SIGINT,
-                      self.__signal_manager.interrupt_signal_handler
-                      )
-        signal.signal(signal.SIGTERM,
-                      self.__signal_manager.kill_signal_handler
-                      )
         self.__stop_event = self.__signal_manager.shut_down_event
         self.__kill_event = self.__signal_manager.kill_event
         self.__logger.debug("initialized.")
@@ -66,12 +76,14 @@ class CommunicatorQueue(CommunicatorBaseClass):
             else:
                 try:
                     # TODO: Configure the timeout value from XML files
-                    current_event = endpoint_queue.get(timeout=10)
+                    current_event = endpoint_queue.get(
+                        timeout=_RECEIVE_TIMEOUT)
                 except queue.Empty:
-                    self.__logger.debug(f'waiting for the event in {queue}!')
+                    self.__logger.debug('waiting for the event in %s!',
+                                        endpoint_queue)
                     continue
                 else:
-                    return current_event
+                    return pickle.loads(current_event)
 
     def send(self, message, endpoint_queue):
         """sends the message to specified endpoint.
@@ -90,7 +102,11 @@ class CommunicatorQueue(CommunicatorBaseClass):
         """
         self.__logger.debug('sending message.')
         try:
-            endpoint_queue.put(message)
+            # NOTE a full queue means that the consumer is stalled, so it is
+            # reported back rather than queueing up more messages
+            endpoint_queue.put(
+                pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL),
+                timeout=_SEND_TIMEOUT)
             self.__logger.debug('message is sent.')
             return Response.OK
         except queue.Full:
@@ -114,13 +130,16 @@ class CommunicatorQueue(CommunicatorBaseClass):
         ------
             return code as int
         """
-        self.__logger.debug(f'broadcasting {message} '
-                            f'to {len(endpoints_queues)}.')
+        self.__logger.debug('broadcasting %s to %s.', message,
+                            len(endpoints_queues))
+        # pickle the message once for all the queues
+        pickled_message = pickle.dumps(message,
+                                       protocol=pickle.HIGHEST_PROTOCOL)
         try:
             for endpoint_queue in endpoints_queues:
-                self.__logger.debug(f'sending to {endpoint_queue}')
-                endpoint_queue.put(message)
-                self.__logger.debug(f'sent {message} to {endpoint_queue}')
+                self.__logger.debug('sending to %s', endpoint_queue)
+                endpoint_queue.put(pickled_message, timeout=_SEND_TIMEOUT)
+                self.__logger.debug('sent %s to %s', message, endpoint_queue)
             return Response.OK
         except queue.Full:
             self.__logger.exception(f'{endpoint_queue} is full.')
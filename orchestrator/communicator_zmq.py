@@ -11,13 +11,20 @@
 #       Team: Multi-scale Simulation and Design
 #
 # ------------------------------------------------------------------------------
-import signal
 import pickle
+import zmq
 
-from EBRAINS_RichEndpoint.application_companion.signal_manager import SignalManager
 from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
 from EBRAINS_RichEndpoint.orchestrator.communicator_base import CommunicatorBaseClass
+from EBRAINS_RichEndpoint.orchestrator.communicator_base import shared_signal_manager
+
+
+# time in milliseconds to wait for a message before checking again whether
+# the process is set to quit
+# NOTE the stop and kill signals end the wait at once, the timeout only
+# covers the quit events which are set otherwise
+_RECEIVE_POLL_TIMEOUT = 1000
 
 
 class CommunicatorZMQ(CommunicatorBaseClass):
@@ -32,14 +39,10 @@ class CommunicatorZMQ(CommunicatorBaseClass):
         self.__logger = self._configurations_manager.load_log_configurations(
                                         name=__name__,
                                         log_configurations=self._log_settings)
-        self.__signal_manager = SignalManager(
+        # NOTE the signal manager and its handlers are shared by all
+        # communicators of the process
+        self.__signal_manager = shared_signal_manager(
                                         self._log_settings, self._configurations_manager)
-        signal.signal(signal.SIGINT,
-                      self.__signal_manager.interrupt_signal_handler
-                      )
-        signal.signal(signal.SIGTERM,
-                      self.__signal_manager.kill_signal_handler
-                      )
         self.__stop_event = self.__signal_manager.shut_down_event
         self.__kill_event = self.__signal_manager.kill_event
         self.__logger.debug("initialized.")
@@ -57,26 +60,67 @@ class CommunicatorZMQ(CommunicatorBaseClass):
         ------
         message received
         """
-        message = None
-        # wait until a message is received or the process is forcefully
+        return self.receive_all(zmq_socket, 1)[0]
+
+    def receive_all(self, zmq_socket, count):
+        """
+        Retrieves the given number of messages. The messages which are
+        already queued on the socket are drained at once without waiting.
+
+        Parameters
+        ----------
+        zmq_socket : ZmqContext.socket
+            the socket bound for receiving
+
+        count : int
+            number of messages to be received
+
+        Returns
+        ------
+        list of messages received
+        NOTE EVENT.FATAL stands in for the messages which could not be
+        received
+        """
+        messages = []
+        # NOTE the wakeup pipe of the signal manager is polled together with
+        # the socket, so that a stop or kill signal ends the wait at once
+        poller = zmq.Poller()
+        poller.register(zmq_socket, zmq.POLLIN)
+        poller.register(self.__signal_manager.wakeup_fd, zmq.POLLIN)
+        # wait until the messages are received or the process is forcefully
         # quit
-        while message is None:
+        while len(messages) < count:
             # check if process is set to forcefully quit
             if self.__stop_event.is_set() or self.__kill_event.is_set():
                 self.__logger.critical('quitting forcefully!')
-                return EVENT.FATAL
-            # Otherwise, wait to receive the message
-            try:
-                message = zmq_socket.recv_pyobj()
-            except Exception:
-                # Case, receive time is out
-                self.__logger.debug(f'socket: {zmq_socket} waiting for the response!')
+                messages.extend([EVENT.FATAL] * (count - len(messages)))
+                break
+            # Otherwise, wait to receive the messages
+            # NOTE the socket is polled rather than relying on a receive
+            # timeout, so waiting does not raise an exception on each timeout
+            if zmq_socket not in dict(poller.poll(_RECEIVE_POLL_TIMEOUT)):
+                # Case, no message is received yet
+                self.__logger.debug('socket: %s waiting for the response!',
+                                    zmq_socket)
                 # continue waiting
                 continue
-
-        # Message is received
-        self.__logger.debug(f'message received: {message}')
-        return message
+            # drain the messages which are already queued
+            while len(messages) < count:
+                try:
+                    messages.append(zmq_socket.recv_pyobj(zmq.NOBLOCK))
+                except zmq.Again:
+                    # Case, no more messages are queued
+                    break
+                except Exception:
+                    # Case, the message could not be received
+                    # log the exception with traceback
+                    self.__logger.exception(f"socket: {zmq_socket} could not "
+                                            "receive the message")
+                    messages.append(EVENT.FATAL)
+
+        # Messages are received
+        self.__logger.debug('messages received: %s', messages)
+        return messages
 
     def send(self, message, zmq_socket):
         """sends the message to specified endpoint.
@@ -93,9 +137,17 @@ class CommunicatorZMQ(CommunicatorBaseClass):
         ------
             return code as int
         """
-        self.__logger.debug(f'sending {message}')
+        self.__logger.debug('sending %s', message)
         try:
-            zmq_socket.send_pyobj(message)
+            # NOTE the receivers unpickle with any protocol, so the highest
+            # protocol is used which pickles faster and more compactly. The
+            # message is still pickled into a single bytes object, the large
+            # buffers are not sent out-of-band.
+            # NOTE the pickled message is not reused, so ZMQ can send it
+            # without copying it once more. The small messages are still
+            # copied since it is cheaper below the copy threshold of pyzmq
+            zmq_socket.send_pyobj(message, protocol=pickle.HIGHEST_PROTOCOL,
+                                  copy=False)
             # message is sent
             return Response.OK
         except Exception:
@@ -124,11 +176,16 @@ class CommunicatorZMQ(CommunicatorBaseClass):
         ------
             return code as int
         """
-        self.__logger.debug(f'broadcasting {message}')
+        self.__logger.debug('broadcasting %s', message)
         try:
             if topic is not None:
                 # send topic in broadcast so the subscriber could filter it
-                zmq_socket.send_multipart([topic, pickle.dumps(message)])
+                # NOTE the message is pickled only once, the PUB socket then
+                # fans it out to all subscribers
+                zmq_socket.send_multipart(
+                    [topic,
+                     pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)],
+                    copy=False)
             else:
                 # just broadcast the message
                 self.send(message, zmq_socket)
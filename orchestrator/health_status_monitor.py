@@ -12,9 +12,9 @@
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
 import threading
-import time
 import signal
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+from EBRAINS_RichEndpoint.registry_state_machine import health_predicates
 
 
 class HealthStatusMonitor:
@@ -39,28 +39,43 @@ class HealthStatusMonitor:
         # counter to rule out the network delay before transitioning the
         # global state to ERROR
         self.__counter = 2  # TODO set value from configuration file
-        # keep track of started threads
-        self.__threads_started = None
-        self.__keep_monitoring = None
+        # keep track of the started monitoring thread
+        self.__monitor_thread = None
+        # set to stop monitoring
+        self.__stop_event = threading.Event()
         self.__logger.debug("initialized.")
 
+    def __snapshot(self):
+        """
+        fetches all components from registry in a single round-trip and
+        returns them together with the ones which have states (i.e. without
+        C&C service).
+        """
+        all_components = self.__health_registry_manager_proxy.find_all()
+        return (all_components,
+                health_predicates.components_with_state(all_components))
+
     def __is_system_healthy(self, all_components, components_with_states):
         """
         helper function to determine whether the system is healthy i.e.
         1) all components are 'UP' and running
         2) local states of all components are same
+
+        NOTE the checks are evaluated locally on the snapshot fetched from
+        registry rather than calling back the registry proxy for each check.
         """
         # check if all components are 'UP' and running
-        if self.__health_registry_manager_proxy.are_all_statuses_up(all_components):
+        if health_predicates.are_all_statuses_up(all_components):
             # Case a: All components are 'UP' and running
             # now, check if all components have same local states
-            return self.__health_registry_manager_proxy.do_all_have_same_state(components_with_states)
+            return health_predicates.do_all_have_same_state(
+                components_with_states)
         else:
             # Case b: some components are 'DOWN'
-            components_with_status_down =\
-                self.__health_registry_manager_proxy.components_with_status_down(all_components)
-            self.__logger.critical(f"components_with_status_down:"
-                                   f" {components_with_status_down}")
+            components_with_status_down = \
+                health_predicates.components_with_status_down(all_components)
+            self.__logger.critical("components_with_status_down: %s",
+                                   components_with_status_down)
             return False
 
     def __is_global_state_up_to_date(self, components_with_states):
@@ -80,12 +95,14 @@ class HealthStatusMonitor:
         signal.raise_signal(signal.SIGINT)
 
     @property
-    def keep_monitoring(self): return self.__keep_monitoring
+    def keep_monitoring(self): return not self.__stop_event.is_set()
 
     def finalize_monitoring(self):
         # stop monitoring
-        self.__keep_monitoring = False
-    
+        # NOTE it also wakes up the monitoring thread if it is waiting for
+        # the next poll
+        self.__stop_event.set()
+
     def __monitor_health_status(self):
         '''
         Target function for monitoring thread to monitors the health and
@@ -105,11 +122,9 @@ class HealthStatusMonitor:
         counter = self.__counter
         # monitoring loop
         while self.keep_monitoring:
-            # fetch all components from registry
-            all_components = self.__health_registry_manager_proxy.find_all()
-            # filter components without states such as C&C service
-            components_with_states =\
-                self.__health_registry_manager_proxy.components_with_state(all_components)
+            # fetch a snapshot of all components from registry once per poll
+            # and filter the components without states such as C&C service
+            all_components, components_with_states = self.__snapshot()
             # 1) Check system health i.e. whether all statuses are 'UP' and
             # the local states are the same
             if not self.__is_system_healthy(all_components, components_with_states):
@@ -126,10 +141,11 @@ class HealthStatusMonitor:
 
                 # Case: network delay is not ruled out yet. So, let the
                 # component update its state in registry.
-                time.sleep(self.__network_delay)
+                if self.__stop_event.wait(self.__network_delay):
+                    break
                 # re-check to rule-out the network delay
-                self.__logger.critical(f'inconsistent local states. '
-                                       f're-checking! counter: {counter}')
+                self.__logger.critical('inconsistent local states. '
+                                       're-checking! counter: %s', counter)
                 counter = counter - 1
                 continue
 
@@ -139,21 +155,22 @@ class HealthStatusMonitor:
                 self.__logger.debug('updating global state')
                 self.__update_global_state()
                 self.__logger.info(
-                    f'global state is updated to '
-                    f'{self.__health_registry_manager_proxy.current_global_state()}')
+                    'global state is updated to %s',
+                    self.__health_registry_manager_proxy.current_global_state())
 
             # everything is fine i.e. all local states are same, all statuses
             # are 'UP' and global state is up-to-date now, reset the counter
             # to rule out network delay
             if counter < self.__counter:
-                self.__logger.debug(f"counter before reset:{counter}")
+                self.__logger.debug("counter before reset:%s", counter)
                 counter = self.__counter
-                self.__logger.debug(f"counter after reset:{counter}")
+                self.__logger.debug("counter after reset:%s", counter)
                 self.__logger.info("The states are consistent and "
                                    "the system is healthy now!")
 
-            # sleep until next poll
-            time.sleep(self.__network_delay)
+            # wait until next poll
+            if self.__stop_event.wait(self.__network_delay):
+                break
             # keep monitoring
             continue
 
@@ -164,7 +181,17 @@ class HealthStatusMonitor:
         '''
         Creates a thread to monitor the local states and statuses
         to validate and transition of the global state.
+        Does not create a new thread if monitoring is already running.
         '''
+        if self.__monitor_thread is not None and self.__monitor_thread.is_alive():
+            if not self.__stop_event.is_set():
+                # Case a: already monitoring
+                self.__logger.debug('monitoring daemon thread is already running.')
+                return Response.OK
+            # Case b: monitoring is stopped but the thread is still exiting,
+            # NOTE it is woken up by finalize_monitoring so it exits promptly
+            self.__monitor_thread.join()
+
         # crate a monitoring thread
         health_status_monitor = threading.Thread(
                                 name='health and status monitor',
@@ -172,16 +199,13 @@ class HealthStatusMonitor:
         # run it in a non-invasive way (in the background)
         # without blocking the health_status_keeper
         health_status_monitor.daemon = True
-        # boolean flag to keep monitoring until the globals state is ERROR
-        self.__keep_monitoring = True
+        # keep monitoring until the globals state is ERROR
+        self.__stop_event.clear()
         health_status_monitor.start()
-        # keep track of running threads
-        # NOTE this also includes the main thread.
-        self.__threads_started = threading.enumerate()
-        self.__logger.debug(f"list threads:"
-                            f"{self.__threads_started}")
-        # test if monitoring threads are running
-        if(len(self.__threads_started) == threading.active_count()):
+        # keep track of the running thread
+        self.__monitor_thread = health_status_monitor
+        # test if monitoring thread is running
+        if self.__monitor_thread.is_alive():
             self.__logger.debug('monitoring daemon thread started.')
             return Response.OK
         else:
@@ -3,6 +3,7 @@
 # "Licensed to the Apache Software Foundation (ASF) under one or more contributor
 #  license agreements; and to You under the Apache License, Version 2.0. "
 # ------------------------------------------------------------------------------
+from multiprocessing import AuthenticationError
 from multiprocessing.managers import BaseManager
 
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
@@ -44,13 +45,9 @@ class ProxyManagerClient:
             response code: int
                 response code indicating if the connection is established
         '''
-        class Manager(BaseManager): pass
-        Manager.register('ServiceRegistryManager')
-        Manager.register('stop_server')
         self.__logger.debug(f"IP: {ip}, port:{port}, key:{key}")
-        self.__proxy_manager_client = Manager(address=(ip, port), authkey=key)
         try:
-            self.__proxy_manager_client.connect()
+            self.__connect(ip, port, key)
         except ConnectionRefusedError:
             # Case a: connection is refused. print the exception and
             # return Error response to terminate
@@ -64,6 +61,48 @@ class ProxyManagerClient:
         self.__logger.debug("Connection is established")
         return Response.OK
 
+    def try_connect(self, ip, port, key):
+        '''
+        tries once to connect with Proxy Manager Server at given IP:Port
+        address using the secret Key for authorization. Unlike connect, it
+        does not terminate if the server is not yet accepting the connections
+        or could not be authorized.
+
+        Parameters
+        ----------
+            ip : string
+                IP address of the server
+
+            port: int
+                port number where server is listening the connection requests
+
+            key: bytes
+                authorization key
+
+        Returns
+        ------
+            response code: int
+                response code indicating if the connection is established
+        '''
+        try:
+            self.__connect(ip, port, key)
+        except (OSError, EOFError, AuthenticationError):
+            # Case a: connection is not established
+            self.__proxy_manager_client = None
+            return Response.ERROR
+
+        # Case b: connection is established
+        self.__logger.debug("Connection is established")
+        return Response.OK
+
+    def __connect(self, ip, port, key):
+        '''connects with Proxy Manager Server at given IP:Port address'''
+        class Manager(BaseManager): pass
+        Manager.register('ServiceRegistryManager')
+        Manager.register('stop_server')
+        self.__proxy_manager_client = Manager(address=(ip, port), authkey=key)
+        self.__proxy_manager_client.connect()
+
     def stop_server(self):
         self.__proxy_manager_client.stop_server()
 
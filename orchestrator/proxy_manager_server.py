@@ -91,9 +91,9 @@ class ProxyManagerServer:
         # register the method to start the timer which set the server stop event
         self.__register_stop_event_timer(server)
         
-        # NOTE the launcher looks via Popen PIPEs for the following print
-        # statement: "starting Proxy Manager Server at" as a conmfirmation
-        # message that the server is started
+        # NOTE the launcher does not wait for this message, it checks whether
+        # the server is started by connecting with it
+        # (see ProxyManagerClient.try_connect)
         print(f"starting Proxy Manager Server at: {server.address}", flush=True)
 
         # start the server
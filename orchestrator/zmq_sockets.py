@@ -28,7 +28,9 @@ class ZMQSockets:
         self.__logger = self._configurations_manager.load_log_configurations(
                                         name=__name__,
                                         log_configurations=self._log_settings)
-        self.__context = zmq.Context()
+        # NOTE the context, and so its IO thread, is shared by all sockets of
+        # the process
+        self.__context = zmq.Context.instance()
         # linger period for pending messages
         # NOTE setting default as 0 i.e. to discard immidiately when the socket is
         # closed with zmq_close()
@@ -67,12 +69,17 @@ class ZMQSockets:
         except:
             # This parameter was recently added by new libzmq versions
             pass
+        # enable TCP keepalives so that the connections to peers which are
+        # gone are detected and closed by the kernel
+        # NOTE TCP_NODELAY is already set by libzmq on all TCP connections,
+        # so the sparse steering messages are not delayed by Nagle's algorithm
+        socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
         # set the maximum time before a recv operation returns with EAGAIN
         if receive_timeout is not None:
             socket.setsockopt(zmq.RCVTIMEO, receive_timeout)
         # accept only routable messages on ROUTER sockets
         if socket_type == zmq.ROUTER:
-            sock.setsockopt(zmq.ROUTER_MANDATORY, 1)
+            socket.setsockopt(zmq.ROUTER_MANDATORY, 1)
         # all is set
         self.__logger.debug(f"created a 0MQ socket: {socket}")
         return socket 
@@ -0,0 +1,55 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2020 Forschungszentrum Jülich GmbH and Aix-Marseille Université
+# "Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements; and to You under the Apache License,
+# Version 2.0. "
+#
+# Forschungszentrum Jülich
+# Institute: Institute for Advanced Simulation (IAS)
+# Section: Jülich Supercomputing Centre (JSC)
+# Division: High Performance Computing in Neuroscience
+# Laboratory: Simulation Laboratory Neuroscience
+# Team: Multi-scale Simulation and Design
+# ------------------------------------------------------------------------------
+from EBRAINS_RichEndpoint.application_companion.common_enums import SERVICE_COMPONENT_STATUS
+
+# NOTE the predicates are shared by the registry manager and the global health
+# monitor, which evaluates them on its own copy of the registered components
+
+
+def are_all_statuses_up(target_components) -> bool:
+    """
+    checks the current local statuses of all components.
+    Returns boolean value indicating whether all current local
+    statuses are 'UP'.
+    """
+    return all(component.current_status is SERVICE_COMPONENT_STATUS.UP
+               for component in target_components)
+
+
+def do_all_have_same_state(target_components) -> bool:
+    """
+    checks whether the current local states of all components is same.
+    Returns boolean value indicating whether all current local states are
+    same.
+    """
+    return len({component.current_state
+                for component in target_components}) <= 1
+
+
+def components_with_state(all_components) -> list:
+    """
+    Filters the components without states such as C&C service, and returns
+    only the components which have states e.g. Application Companions.
+    """
+    return [component for component in all_components
+            if component.current_state is not None]
+
+
+def components_with_status_down(all_components) -> list:
+    """
+    Filters the components with status 'DOWN' from the list of given
+    components and returns a list of them.
+    """
+    return [component for component in all_components
+            if component.current_status is SERVICE_COMPONENT_STATUS.DOWN]
@@ -11,14 +11,16 @@
 # Laboratory: Simulation Laboratory Neuroscience
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
+import threading
+
 from EBRAINS_RichEndpoint.registry_state_machine.service_component import ServiceComponent
 from EBRAINS_RichEndpoint.registry_state_machine.service_registry import ServiceRegistry
 from EBRAINS_RichEndpoint.registry_state_machine.state_transition_validator import StateTransitionValidator
 from EBRAINS_RichEndpoint.registry_state_machine.health_status_keeper import HealthStatusKeeper
 from EBRAINS_RichEndpoint.registry_state_machine.state_enums import STATES
 from EBRAINS_RichEndpoint.registry_state_machine.state_transition_record import LocalStateTransitionRecord
+from EBRAINS_RichEndpoint.registry_state_machine import health_predicates
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
-from EBRAINS_RichEndpoint.application_companion.common_enums import SERVICE_COMPONENT_STATUS
 
 
 class MetaHealthRegistryManager(type):
@@ -50,6 +52,8 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
                                         log_configurations=self._log_settings)
         # instantiate service registry
         self.__service_registry = ServiceRegistry()
+        # condition to notify the waiting clients about new registrations
+        self.__registration_condition = threading.Condition()
         # instantiate state transition manager
         self.__state_transition_validator = StateTransitionValidator(
                                                 self._log_settings,
@@ -106,7 +110,7 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         # get next legal state as per the transition rule
         next_state = self.__state_transition_validator.next_valid_local_state(
             current_state, input_command)
-        self.__logger.debug(f"next legal state: {next_state}")
+        self.__logger.debug("next legal state: %s", next_state)
         if next_state == Response.ERROR:
             # log the exception with traceback
             self.__log_exception_with_traceback('Illegal transition rule')
@@ -122,8 +126,8 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         # record the transition to history
         self.__global_state_transition_history.append(
             self.current_global_state().name)
-        self.__logger.debug(f'current global state state after update: '
-                            f'{self.current_global_state()}')
+        self.__logger.debug('current global state state after update: %s',
+                            self.current_global_state())
         if next_valid_global_state == STATES.ERROR:
             # log the exception with traceback
             self.__log_exception_with_traceback('Transition Rule is not satisfied')
@@ -135,8 +139,9 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         """helper function to update the local state of target component"""
         target_component.current_state = next_valid_state
         if self.__update_component_in_registry(target_component):
-            self.__logger.debug(f'{target_component.name} local state is updated '
-                                f'to: {target_component.current_state}')
+            self.__logger.debug('%s local state is updated to: %s',
+                                target_component.name,
+                                target_component.current_state)
             # state is updated, return proxy to up-to-date component
             return target_component
         else:
@@ -191,7 +196,11 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         service_component = ServiceComponent(id, name, category, endpoint,
                                              current_status, current_state)
         # register the data object in registry
-        return self.__service_registry.register(service_component)
+        with self.__registration_condition:
+            response = self.__service_registry.register(service_component)
+            # notify the clients waiting for the registrations
+            self.__registration_condition.notify_all()
+        return response
 
     # NOTE: This functionality is provided only for the sake of completion.
     # Uncomment it if the functionality is needed.
@@ -214,6 +223,40 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         '''wrapper to fetch all components from registry by given category.'''
         return self.__service_registry.find_all_by_category(category)
 
+    def find_all_by_categories(self, categories) -> dict:
+        '''
+        wrapper to fetch all components from registry by given categories,
+        mapped to their categories.
+        '''
+        return {category: self.find_all_by_category(category)
+                for category in categories}
+
+    def wait_for_categories(self, expected_counts, timeout=None) -> dict:
+        '''
+        waits until at least the expected number of components of each given
+        category are registered or the timeout expires, and then fetches all
+        components from registry by given categories.
+
+        Parameters
+        ----------
+        expected_counts : dict
+            expected number of components mapped to their categories
+
+        timeout : float
+            maximum time in seconds to wait, None to wait without limit
+
+        Returns
+        -------
+         components mapped to their categories
+        '''
+        with self.__registration_condition:
+            self.__registration_condition.wait_for(
+                lambda: all(
+                    len(self.find_all_by_category(category)) >= expected_count
+                    for category, expected_count in expected_counts.items()),
+                timeout)
+            return self.find_all_by_categories(expected_counts)
+
     def find_all_by_status(self, status) -> list:
         '''wrapper to fetch all components from registry by given status.'''
         return self.__service_registry.find_all_by_status(status)
@@ -241,11 +284,11 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         """
         component.current_status = current_status
         if self.__update_component_in_registry(component):
-            self.__logger.debug(f'{component.name}: status is updated.')
+            self.__logger.debug('%s: status is updated.', component.name)
             return self.find_by_id(component.id)
         else:
-            self.__logger.error(f'{component.name}: '
-                                f'status could not be updated.')
+            self.__logger.error('%s: status could not be updated.',
+                                component.name)
             return Response.ERROR
 
     def are_all_statuses_up(self, target_components) -> bool:
@@ -254,8 +297,7 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         Returns boolean value indicating whether all current local
         statuses are 'UP'.
         """
-        return all(component.current_status == SERVICE_COMPONENT_STATUS.UP
-                   for component in target_components)
+        return health_predicates.are_all_statuses_up(target_components)
 
     def do_all_have_same_state(self, tar_components) -> bool:
         """"
@@ -263,9 +305,7 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         Returns boolean value indicating whether all current local states are
         same.
         """
-        return all(
-            component.current_state == tar_components[0].current_state
-            for component in tar_components)
+        return health_predicates.do_all_have_same_state(tar_components)
 
     def components_with_state(self, all_components):
         """
@@ -285,12 +325,10 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         components_with_state: list
             list of components which have states e.g. Application Companions
         """
-        components_with_states = []
-        for component in all_components:
-            if component.current_state is not None:
-                components_with_states.append(component)
-        self.__logger.debug(f'all components: {all_components}; '
-                            f'with states: {components_with_states}')
+        components_with_states = health_predicates.components_with_state(
+            all_components)
+        self.__logger.debug('all components: %s; with states: %s',
+                            all_components, components_with_states)
         return components_with_states
 
     def current_global_status(self):
@@ -312,7 +350,7 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
     def system_up_time(self):
         """wrapper function to fetch the up time of system since the start."""
         uptime_till_now = self.__global_health_keeper.uptime_till_now()
-        self.__logger.debug(f"up time till now: {uptime_till_now}")
+        self.__logger.debug("up time till now: %s", uptime_till_now)
         return uptime_till_now     
 
     def update_global_state(self):
@@ -323,8 +361,8 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         Returns an int code indicating whether or not the globals state is
         updated.
         """
-        self.__logger.debug(f'current global state before update: '
-                            f'{self.current_global_state()}')
+        self.__logger.debug('current global state before update: %s',
+                            self.current_global_state())
         # 1) fetch all components from registry
         all_components = self.find_all()
         components_with_states = self.components_with_state(all_components)
@@ -363,8 +401,8 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
             next legal state or not
         """
         current_state = component.current_state
-        self.__logger.debug(f'current local state: {current_state}')
-        self.__logger.debug(f'input command: {input_command}')
+        self.__logger.debug('current local state: %s', current_state)
+        self.__logger.debug('input command: %s', input_command)
         # validate transition rule to get the next legal state
         next_legal_state = self.__next_valid_local_state(
             current_state, input_command)
@@ -398,13 +436,7 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         components_not_running: list
             list of components which status 'DOWN'
         """
-        components_not_running = []
-        for component in all_components:
-            self.__logger.debug(f'{component.name} status: '
-                                f'{component.current_status}.')
-            if component.current_status == SERVICE_COMPONENT_STATUS.DOWN:
-                components_not_running.append(component)
-        return components_not_running
+        return health_predicates.components_with_status_down(all_components)
 
     def update_state_transition_history(self, state_before_transition,
                                         input_command, state_after_transition):
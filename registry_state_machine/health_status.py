@@ -12,23 +12,27 @@
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
 from dataclasses import dataclass
-from dataclasses import field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class HealthStatus:
     """
     Data class for global health and status.
     The attributes are not necessary to be initialized during instantiation.
     """
     # make uptime a private member so it cannot be altered later
-    __uptime: datetime = field(default=datetime.now())
+    __uptime: datetime
     current_global_state: Any
     current_global_status: Any
     last_updated: datetime
 
+    def __init__(self) -> None:
+        # NOTE uptime is captured per instance at its creation rather than
+        # once when the class is defined
+        self.__uptime = datetime.now()
+
     # make a read only public attribute to access the uptime
     @property
     def uptime(self) -> datetime: return self.__uptime
@@ -0,0 +1,92 @@
+import logging
+import pickle
+import queue
+import signal
+import unittest
+from unittest import mock
+
+from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT
+from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+from EBRAINS_RichEndpoint.orchestrator import communicator_base
+from EBRAINS_RichEndpoint.orchestrator import communicator_queue
+from EBRAINS_RichEndpoint.orchestrator.communicator_queue import CommunicatorQueue
+
+
+class CommunicatorQueueTest(unittest.TestCase):
+    """Tests the behavior of CommunicatorQueue class."""
+
+    def setUp(self):
+        """creates the communicator with its own signal manager."""
+        # NOTE the communicator installs the handlers for SIGINT and SIGTERM,
+        # they are restored after each test
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            self.addCleanup(signal.signal, signal_number,
+                            signal.getsignal(signal_number))
+        for patcher in (
+                mock.patch.dict(communicator_base._signal_managers,
+                                clear=True),
+                mock.patch.object(communicator_base,
+                                  '_signal_handlers_installed', set())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.configurations_manager = mock.Mock()
+        self.configurations_manager.load_log_configurations.return_value = \
+            logging.getLogger(__name__)
+        self.communicator = CommunicatorQueue({}, self.configurations_manager)
+
+    def test_send_puts_pickled_message(self):
+        """Case: a message is sent.
+        It should be put on the queue in its pickled form."""
+        endpoint_queue = queue.Queue()
+        message = {'command': 'START', 'parameters': [1, 2]}
+        self.assertEqual(Response.OK,
+                         self.communicator.send(message, endpoint_queue))
+        sent = endpoint_queue.get_nowait()
+        # tests: the message is pickled
+        self.assertIsInstance(sent, bytes)
+        self.assertEqual(message, pickle.loads(sent))
+
+    def test_receive_unpickles_message(self):
+        """Case: a sent message is received.
+        It should be the same as the sent one."""
+        endpoint_queue = queue.Queue()
+        self.communicator.send(('START', 1.2), endpoint_queue)
+        self.assertEqual(('START', 1.2),
+                         self.communicator.receive(endpoint_queue))
+
+    def test_broadcast_pickles_once(self):
+        """Case: a message is broadcast to several queues.
+        It should be pickled only once and put on all queues."""
+        endpoints_queues = [queue.Queue() for _ in range(3)]
+        with mock.patch.object(communicator_queue.pickle, 'dumps',
+                               wraps=pickle.dumps) as dumps:
+            self.assertEqual(Response.OK, self.communicator.broadcast_all(
+                'START', endpoints_queues))
+        # tests: the message is pickled once
+        self.assertEqual(1, dumps.call_count)
+        # tests: all queues received it
+        for endpoint_queue in endpoints_queues:
+            self.assertEqual('START', self.communicator.receive(
+                endpoint_queue))
+
+    def test_send_to_full_queue(self):
+        """Case: the queue stays full.
+        It should respond with ERROR once the send timeout expires."""
+        endpoint_queue = queue.Queue(maxsize=1)
+        endpoint_queue.put(b'')
+        with mock.patch.object(communicator_queue, '_SEND_TIMEOUT', 0.01):
+            self.assertEqual(Response.ERROR,
+                             self.communicator.send('START', endpoint_queue))
+
+    def test_receive_after_stop_signal(self):
+        """Case: a stop signal is received while waiting.
+        It should return EVENT.FATAL."""
+        signal_manager = communicator_base.shared_signal_manager(
+            {}, self.configurations_manager)
+        signal_manager.interrupt_signal_handler()
+        self.assertEqual(EVENT.FATAL,
+                         self.communicator.receive(queue.Queue()))
+
+
+if __name__ == "__main__":
+    unittest.main()
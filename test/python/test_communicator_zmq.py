@@ -0,0 +1,106 @@
+import logging
+import pickle
+import signal
+import threading
+import time
+import unittest
+from unittest import mock
+
+import zmq
+
+from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT
+from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+from EBRAINS_RichEndpoint.orchestrator import communicator_base
+from EBRAINS_RichEndpoint.orchestrator import communicator_zmq
+from EBRAINS_RichEndpoint.orchestrator.communicator_zmq import CommunicatorZMQ
+
+
+class CommunicatorZMQTest(unittest.TestCase):
+    """Tests the behavior of CommunicatorZMQ class."""
+
+    def setUp(self):
+        """creates the communicator with its own signal manager and a pair
+        of connected sockets."""
+        # NOTE the communicator installs the handlers for SIGINT and SIGTERM,
+        # they are restored after each test
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            self.addCleanup(signal.signal, signal_number,
+                            signal.getsignal(signal_number))
+        for patcher in (
+                mock.patch.dict(communicator_base._signal_managers,
+                                clear=True),
+                mock.patch.object(communicator_base,
+                                  '_signal_handlers_installed', set())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.configurations_manager = mock.Mock()
+        self.configurations_manager.load_log_configurations.return_value = \
+            logging.getLogger(__name__)
+        self.communicator = CommunicatorZMQ({}, self.configurations_manager)
+        context = zmq.Context()
+        self.addCleanup(context.term)
+        self.pull_socket = context.socket(zmq.PULL)
+        self.addCleanup(self.pull_socket.close, 0)
+        self.pull_socket.bind('inproc://receive')
+        self.push_socket = context.socket(zmq.PUSH)
+        self.addCleanup(self.push_socket.close, 0)
+        self.push_socket.connect('inproc://receive')
+        self.pub_socket = context.socket(zmq.PUB)
+        self.addCleanup(self.pub_socket.close, 0)
+        self.pub_socket.bind('inproc://broadcast')
+        self.sub_socket = context.socket(zmq.SUB)
+        self.addCleanup(self.sub_socket.close, 0)
+        self.sub_socket.connect('inproc://broadcast')
+
+    def test_receive_all_drains_queued_messages(self):
+        """Case: all messages are already queued on the socket.
+        It should return all of them in the order they are sent."""
+        for message in range(3):
+            self.assertEqual(Response.OK,
+                             self.communicator.send(message, self.push_socket))
+        self.assertEqual([0, 1, 2],
+                         self.communicator.receive_all(self.pull_socket, 3))
+
+    def test_receive_waits_for_message(self):
+        """Case: the message is sent while waiting.
+        It should return it."""
+        sender = threading.Timer(0.1, self.communicator.send,
+                                 args=('START', self.push_socket))
+        sender.start()
+        self.addCleanup(sender.join)
+        self.assertEqual('START', self.communicator.receive(self.pull_socket))
+
+    def test_receive_all_after_stop_signal(self):
+        """Case: a stop signal is received while waiting.
+        It should return the received messages and EVENT.FATAL for the rest
+        without waiting for the poll timeout."""
+        signal_manager = communicator_base.shared_signal_manager(
+            {}, self.configurations_manager)
+        self.communicator.send('START', self.push_socket)
+        stop = threading.Timer(0.1, signal_manager.interrupt_signal_handler)
+        stop.start()
+        self.addCleanup(stop.join)
+        started_at = time.monotonic()
+        messages = self.communicator.receive_all(self.pull_socket, 3)
+        # tests: the wait ends with the signal
+        self.assertLess(time.monotonic() - started_at,
+                        communicator_zmq._RECEIVE_POLL_TIMEOUT / 1000)
+        # tests: the missing messages are filled with EVENT.FATAL
+        self.assertEqual(['START', EVENT.FATAL, EVENT.FATAL], messages)
+
+    def test_broadcast_with_topic(self):
+        """Case: a message is broadcast with a topic.
+        It should be received as the topic and the pickled message."""
+        self.sub_socket.setsockopt(zmq.SUBSCRIBE, b'topic')
+        # NOTE the subscription reaches the publisher asynchronously
+        time.sleep(0.1)
+        self.assertEqual(Response.OK, self.communicator.broadcast_all(
+            {'command': 'START'}, self.pub_socket, topic=b'topic'))
+        self.assertTrue(self.sub_socket.poll(1000))
+        topic, message = self.sub_socket.recv_multipart()
+        self.assertEqual(b'topic', topic)
+        self.assertEqual({'command': 'START'}, pickle.loads(message))
+
+
+if __name__ == "__main__":
+    unittest.main()
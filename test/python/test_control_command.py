@@ -0,0 +1,65 @@
+import logging
+import pickle
+import unittest
+from unittest import mock
+
+from EBRAINS_RichEndpoint.application_companion.common_enums import COMMANDS
+from EBRAINS_RichEndpoint.application_companion.common_enums import SteeringCommands
+from EBRAINS_RichEndpoint.orchestrator.control_command import Command
+from EBRAINS_RichEndpoint.orchestrator.control_command import ControlCommand
+
+
+class ControlCommandTest(unittest.TestCase):
+    """Tests the behavior of ControlCommand class."""
+
+    def setUp(self):
+        configurations_manager = mock.Mock()
+        configurations_manager.load_log_configurations.return_value = \
+            logging.getLogger(__name__)
+        self.control_command = ControlCommand({}, configurations_manager)
+
+    def test_parse_before_prepare(self):
+        """Case: the command is not yet prepared.
+        It should parse to neither steering command nor parameters."""
+        self.assertEqual((None, None), tuple(self.control_command.parse()))
+
+    def test_prepare_and_parse(self):
+        """Case: the command is prepared.
+        It should parse to the given steering command and parameters."""
+        prepared = self.control_command.prepare(SteeringCommands.START, 1.2)
+        steering_command, parameters = self.control_command.parse()
+        # tests: the prepared command is returned
+        self.assertEqual(Command(SteeringCommands.START, 1.2), prepared)
+        # tests: it parses to the given values
+        self.assertIs(SteeringCommands.START, steering_command)
+        self.assertEqual(1.2, parameters)
+
+    def test_update_parameters(self):
+        """Case: the parameters are updated.
+        It should keep the steering command."""
+        self.control_command.prepare(SteeringCommands.START, 1.2)
+        self.control_command.update_paramters([{'action': 'x'}])
+        steering_command, parameters = self.control_command.parse()
+        self.assertIs(SteeringCommands.START, steering_command)
+        self.assertEqual([{'action': 'x'}], parameters)
+
+    def test_command_as_dictionary(self):
+        """Case: the command is sent to the application via stdio.
+        It should keep the dictionary form expected by the application."""
+        self.control_command.prepare(SteeringCommands.START, 1.2)
+        self.assertEqual({COMMANDS.STEERING_COMMAND.name: SteeringCommands.START,
+                          COMMANDS.PARAMETERS.name: 1.2},
+                         self.control_command.command)
+
+    def test_pickle(self):
+        """Case: the command is sent to the other components pickled.
+        It should parse to the same values after unpickling."""
+        self.control_command.prepare(SteeringCommands.END, None)
+        unpickled = pickle.loads(pickle.dumps(self.control_command))
+        steering_command, parameters = unpickled.parse()
+        self.assertIs(SteeringCommands.END, steering_command)
+        self.assertIsNone(parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
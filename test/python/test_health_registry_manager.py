@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+import unittest
+from unittest import mock
+
+from EBRAINS_RichEndpoint.application_companion.common_enums import SERVICE_COMPONENT_CATEGORY
+from EBRAINS_RichEndpoint.application_companion.common_enums import SERVICE_COMPONENT_STATUS
+from EBRAINS_RichEndpoint.registry_state_machine.health_registry_manager import HealthRegistryManager
+from EBRAINS_RichEndpoint.registry_state_machine.health_registry_manager import MetaHealthRegistryManager
+from EBRAINS_RichEndpoint.registry_state_machine.state_enums import STATES
+
+
+class HealthRegistryManagerWaitForCategoriesTest(unittest.TestCase):
+    """Tests the behavior of HealthRegistryManager.wait_for_categories."""
+
+    def setUp(self):
+        """creates a new registry for each test."""
+        # NOTE HealthRegistryManager is a singleton, a new instance is
+        # created by forgetting the existing one
+        patcher = mock.patch.dict(MetaHealthRegistryManager._instances,
+                                  clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        configurations_manager = mock.Mock()
+        configurations_manager.load_log_configurations.return_value = \
+            logging.getLogger(__name__)
+        self.registry = HealthRegistryManager({}, configurations_manager)
+        self.next_id = 0
+
+    def __register(self, category):
+        """registers a component of given category."""
+        self.next_id += 1
+        self.registry.register(self.next_id, category.name, category, None,
+                               SERVICE_COMPONENT_STATUS.UP,
+                               STATES.READY)
+
+    def test_returns_at_once_if_already_registered(self):
+        """Case: the expected components are already registered.
+        It should return them without waiting for the timeout."""
+        self.__register(SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION)
+        self.__register(SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION)
+        self.__register(SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR)
+        started_at = time.monotonic()
+        components = self.registry.wait_for_categories(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION: 2,
+             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: 1},
+            timeout=5)
+        # tests: it does not wait
+        self.assertLess(time.monotonic() - started_at, 1)
+        # tests: the components are mapped to their categories
+        self.assertEqual(2, len(components[
+            SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION]))
+        self.assertEqual(1, len(components[
+            SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR]))
+
+    def test_returns_registered_components_after_timeout(self):
+        """Case: not all expected components are registered.
+        It should return the registered ones once the timeout expires."""
+        self.__register(SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION)
+        started_at = time.monotonic()
+        components = self.registry.wait_for_categories(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION: 2,
+             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: 1},
+            timeout=0.2)
+        # tests: it waits for the timeout
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.2)
+        # tests: the registered components are returned
+        self.assertEqual(1, len(components[
+            SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION]))
+        self.assertEqual([], components[
+            SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR])
+
+    def test_wakes_up_on_registration(self):
+        """Case: the last expected component is registered while waiting.
+        It should return as soon as it is registered."""
+        self.__register(SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION)
+        registration = threading.Timer(
+            0.1, self.__register,
+            args=(SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR,))
+        registration.start()
+        self.addCleanup(registration.join)
+        started_at = time.monotonic()
+        components = self.registry.wait_for_categories(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION: 1,
+             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: 1},
+            timeout=5)
+        # tests: it returns before the timeout
+        self.assertLess(time.monotonic() - started_at, 1)
+        # tests: the newly registered component is returned
+        self.assertEqual(1, len(components[
+            SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import time
+import unittest
+from datetime import datetime
+
+from EBRAINS_RichEndpoint.registry_state_machine.health_status import HealthStatus
+
+
+class HealthStatusTest(unittest.TestCase):
+    """Tests the behavior of HealthStatus data class."""
+
+    def test_uptime_is_captured_at_instantiation(self):
+        """Case: the uptime is the time when the instance is created rather
+        than the time when the module is imported."""
+        before = datetime.now()
+        health_status = HealthStatus()
+        after = datetime.now()
+        # tests: the uptime is captured while instantiating
+        self.assertTrue(before <= health_status.uptime <= after)
+
+    def test_uptime_is_not_shared_across_instances(self):
+        """Case: each instance keeps its own uptime."""
+        first = HealthStatus()
+        time.sleep(0.01)
+        second = HealthStatus()
+        # tests: the later instance has the later uptime
+        self.assertLess(first.uptime, second.uptime)
+
+    def test_attributes_can_be_updated(self):
+        """Case: the global state and status are set after instantiation as
+        done by HealthStatusKeeper."""
+        health_status = HealthStatus()
+        last_updated = datetime.now()
+        health_status.current_global_state = 'READY'
+        health_status.current_global_status = 'UP'
+        health_status.last_updated = last_updated
+        # tests: the updated values are kept
+        self.assertEqual('READY', health_status.current_global_state)
+        self.assertEqual('UP', health_status.current_global_status)
+        self.assertEqual(last_updated, health_status.last_updated)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,331 @@
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+import types
+import unittest
+from unittest import mock
+
+from EBRAINS_RichEndpoint import launcher_hpc
+from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+from EBRAINS_RichEndpoint.application_companion.common_enums import SERVICE_COMPONENT_CATEGORY
+from EBRAINS_RichEndpoint.launcher_hpc import LauncherHPC
+
+
+def _python(code):
+    """returns the command to run the given python code"""
+    return [sys.executable, "-c", code]
+
+
+def _os_without_pidfd():
+    """returns the os module as it is on the platforms without pidfd"""
+    os_without_pidfd = types.ModuleType(os.__name__)
+    os_without_pidfd.__dict__.update(
+        (name, value) for name, value in vars(os).items()
+        if name != "pidfd_open")
+    return os_without_pidfd
+
+
+class LauncherHPCTest(unittest.TestCase):
+    """Tests the behavior of LauncherHPC class."""
+
+    def setUp(self):
+        """creates the launcher with the default timeouts."""
+        self.logger = logging.getLogger(__name__)
+        self.configurations_manager = mock.Mock()
+        self.configurations_manager.load_log_configurations.return_value = \
+            self.logger
+        self.launcher = self.__create_launcher()
+
+    def __create_launcher(self, **kwargs):
+        """creates the launcher with the given timeouts"""
+        return LauncherHPC(
+            {}, self.configurations_manager,
+            proxy_manager_server_address={
+                "IP": "127.0.0.1", "PORT": 0, "KEY": b"key"},
+            communication_settings_dict={
+                name: {"MIN": 0, "MAX": 0} for name in (
+                    "ORCHESTRATOR", "COMMAND_CONTROL",
+                    "APPLICATION_COMPANION", "APPLICATION_MANAGER",
+                    "APP_SERVER")},
+            **kwargs)
+
+    def __popen(self, code, **kwargs):
+        """starts the given python code in a new process"""
+        process = subprocess.Popen(_python(code), **kwargs)
+        self.addCleanup(self.__kill, process)
+        return process
+
+    def __spawn_component(self, code, component_name="COMPONENT", **kwargs):
+        """launches the given python code as a component"""
+        process = self.launcher._LauncherHPC__spawn_component(
+            _python(code), component_name, **kwargs)
+        self.addCleanup(self.__kill, process)
+        return process
+
+    @staticmethod
+    def __kill(process):
+        """kills the process if it is still running"""
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        for stream in (process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
+
+    def __pidfd_support(self):
+        """
+        yields the contexts to run the test with and without pidfd support
+        """
+        yield "pidfd", mock.patch.object(launcher_hpc, "os", os)
+        yield "no pidfd", mock.patch.object(launcher_hpc, "os",
+                                            _os_without_pidfd())
+
+    def __set_registered_components(self, registered_components):
+        """
+        sets the components registered with registry, mapped to their
+        categories
+        """
+        registry = mock.Mock()
+        registry.wait_for_categories.return_value = registered_components
+        registry.find_all_by_categories.return_value = registered_components
+        self.launcher._LauncherHPC__health_registry_manager_proxy = registry
+        return registry
+
+    def test_wait_for_processes_reaps_all(self):
+        """Case: the processes finish at different times.
+        It should return once all of them are finished and reaped."""
+        for support, context in self.__pidfd_support():
+            with self.subTest(support=support), context:
+                processes = {
+                    self.__popen("pass"): "FIRST",
+                    self.__popen("import time; time.sleep(0.3)"): "SECOND"}
+                started_at = time.monotonic()
+                self.launcher._LauncherHPC__wait_for_processes(processes)
+                # tests: it waits for the slowest process
+                self.assertGreaterEqual(time.monotonic() - started_at, 0.25)
+                # tests: all processes are reaped
+                self.assertEqual([0, 0], [process.returncode
+                                          for process in processes])
+
+    def test_shutdown_timeout_after_abnormal_exit(self):
+        """Case: a process exits with an error while the other hangs.
+        It should stop the hanging process once the shutdown timeout
+        expires."""
+        self.launcher = self.__create_launcher(shutdown_timeout=0.2)
+        for support, context in self.__pidfd_support():
+            with self.subTest(support=support), context:
+                hanging_process = self.__popen(
+                    "import time; time.sleep(30)")
+                processes = {self.__popen("raise SystemExit(1)"): "FAILING",
+                             hanging_process: "HANGING"}
+                started_at = time.monotonic()
+                self.launcher._LauncherHPC__wait_for_processes(processes)
+                # tests: it does not wait for the hanging process to finish
+                self.assertLess(time.monotonic() - started_at, 10)
+                # tests: the hanging process is terminated
+                self.assertEqual(-signal.SIGTERM, hanging_process.returncode)
+
+    def test_no_shutdown_timeout_after_normal_exit(self):
+        """Case: a process finishes normally earlier than the other.
+        It should wait for the other process without the shutdown
+        timeout."""
+        self.launcher = self.__create_launcher(shutdown_timeout=0.1)
+        for support, context in self.__pidfd_support():
+            with self.subTest(support=support), context:
+                slower_process = self.__popen("import time; time.sleep(0.5)")
+                processes = {self.__popen("pass"): "FASTER",
+                             slower_process: "SLOWER"}
+                self.launcher._LauncherHPC__wait_for_processes(processes)
+                # tests: the slower process finishes on its own
+                self.assertEqual(0, slower_process.returncode)
+
+    def test_checkpoint_services_registered(self):
+        """Case: all launched components are registered.
+        It should report no broken services after a single registry
+        query."""
+        application_companions = [mock.Mock(pid=1), mock.Mock(pid=2)]
+        orchestrator = mock.Mock(pid=3)
+        registry = self.__set_registered_components({
+            SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION: ["1", "2"],
+            SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: ["3"]})
+        broken_services = self.launcher._LauncherHPC__checkpoint_services(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION:
+                application_companions,
+             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: [orchestrator]},
+            time.time())
+        # tests: no services are broken
+        self.assertEqual({}, broken_services)
+        # tests: the registry is queried once for all services
+        registry.wait_for_categories.assert_called_once()
+        self.assertEqual(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION: 2,
+             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: 1},
+            registry.wait_for_categories.call_args.args[0])
+
+    def test_checkpoint_services_with_exited_process(self):
+        """Case: a launched process exits without registering.
+        It should report the shortfall and the exited process without
+        waiting for the launch deadline."""
+        exited_process = mock.Mock(pid=2)
+        exited_process.poll.return_value = 1
+        running_processes = [mock.Mock(pid=1), mock.Mock(pid=3)]
+        for process in running_processes:
+            process.poll.return_value = None
+        self.__set_registered_components({
+            SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION: ["1"],
+            SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: ["3"]})
+        broken_services = self.launcher._LauncherHPC__checkpoint_services(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION:
+                [running_processes[0], exited_process],
+             SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: [running_processes[1]]},
+            time.time())
+        # tests: only the broken service is reported with its exited process
+        self.assertEqual(
+            {SERVICE_COMPONENT_CATEGORY.APPLICATION_COMPANION.name: {
+                "expected": 2, "registered": 1, "exited (pids)": [2]}},
+            broken_services)
+
+    def test_checkpoint_services_after_launch_deadline(self):
+        """Case: the launched process neither registers nor exits.
+        It should report the service as broken once the launch deadline is
+        passed."""
+        running_process = mock.Mock(pid=1)
+        running_process.poll.return_value = None
+        self.__set_registered_components({
+            SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: []})
+        self.launcher._LauncherHPC__launch_deadline = time.monotonic()
+        broken_services = self.launcher._LauncherHPC__checkpoint_services(
+            {SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR: [running_process]},
+            time.time())
+        self.assertEqual(
+            {SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR.name: {
+                "expected": 1, "registered": 0, "exited (pids)": []}},
+            broken_services)
+
+    def test_terminate_launched_components(self):
+        """Case: the launched components are torn down.
+        It should terminate the components in the process group at once,
+        the interactive one on its own, and kill the ones which do not
+        terminate within the grace period."""
+        running_code = ("import time; print('running', flush=True); "
+                        "time.sleep(30)")
+        components = [self.__spawn_component(
+            running_code, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            for _ in range(2)]
+        unresponsive_component = self.__spawn_component(
+            "import signal; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+            + running_code,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        interactive_component = self.__spawn_component(
+            running_code, stdout=subprocess.PIPE, is_interactive=True)
+        launched_components = [*components, unresponsive_component,
+                               interactive_component]
+        # wait until all components are running
+        for component in launched_components:
+            self.assertEqual(b"running\n", component.stdout.readline())
+        # tests: the non-interactive components are in one process group
+        # other than the one of the launcher
+        process_group = os.getpgid(components[0].pid)
+        self.assertNotEqual(os.getpgrp(), process_group)
+        self.assertEqual(
+            [process_group] * 3,
+            [os.getpgid(component.pid) for component in
+             [*components, unresponsive_component]])
+        # tests: the interactive component stays in the process group of the
+        # launcher
+        self.assertEqual(os.getpgrp(),
+                         os.getpgid(interactive_component.pid))
+        self.launcher._LauncherHPC__terminate_launched_components()
+        # tests: all components are terminated and reaped
+        self.assertEqual(
+            [-signal.SIGTERM, -signal.SIGTERM, -signal.SIGKILL,
+             -signal.SIGTERM],
+            [component.returncode for component in launched_components])
+
+    def test_new_process_group_after_all_finished(self):
+        """Case: all components in the process group are already finished.
+        It should launch the next component in a new process group."""
+        finished_component = self.__spawn_component(
+            "pass", stdout=subprocess.DEVNULL)
+        finished_component.wait()
+        component = self.__spawn_component(
+            "import time; time.sleep(30)", stdout=subprocess.DEVNULL)
+        self.assertEqual(component.pid, os.getpgid(component.pid))
+
+    def test_outputs_logged_at_info(self):
+        """Case: a component writes to its output and error streams and
+        finishes normally.
+        It should log both with its name and pid as prefix at INFO level."""
+        with self.assertLogs(self.logger, level=logging.INFO) as logs:
+            component = self.__spawn_component(
+                "import sys; print('output'); "
+                "sys.stderr.write('log record')", "SERVICE")
+            self.launcher._LauncherHPC__wait_for_processes(
+                {component: "SERVICE"})
+            self.launcher._LauncherHPC__join_output_reader()
+        records = [(record.levelno, record.getMessage())
+                   for record in logs.records]
+        prefix = f"SERVICE (pid: {component.pid}): "
+        # tests: the outputs are logged with the prefix at INFO level
+        self.assertIn((logging.INFO, prefix + "output"), records)
+        self.assertIn((logging.INFO, prefix + "log record"), records)
+        # tests: nothing is logged as an error
+        self.assertEqual([], [record for record in logs.records
+                              if record.levelno >= logging.ERROR])
+
+    def test_errors_logged_after_abnormal_exit(self):
+        """Case: a component writes to its error stream and exits with an
+        error.
+        It should log the last lines of the error stream again at ERROR
+        level with the return code."""
+        with self.assertLogs(self.logger, level=logging.INFO) as logs:
+            component = self.__spawn_component(
+                "import sys; sys.stderr.write('first\\nsecond\\n'); "
+                "sys.exit(3)", "SERVICE")
+            self.launcher._LauncherHPC__wait_for_processes(
+                {component: "SERVICE"})
+            self.launcher._LauncherHPC__join_output_reader()
+        errors = [record.getMessage() for record in logs.records
+                  if record.levelno == logging.ERROR
+                  and "last errors" in record.getMessage()]
+        self.assertEqual(
+            [f"SERVICE (pid: {component.pid}) exited with return code 3, "
+             "last errors:\nfirst\nsecond"],
+            errors)
+
+    def test_read_popen_pipes_until_signal(self):
+        """Case: the signal to continue is written in two parts while the
+        process keeps running.
+        It should return as soon as the whole signal is read."""
+        process = self.__popen(
+            "import sys, time; "
+            "sys.stderr.write('POST /sub'); sys.stderr.flush(); "
+            "time.sleep(0.2); "
+            "sys.stderr.write('mit HTTP/1.1'); sys.stderr.flush(); "
+            "time.sleep(30)",
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        started_at = time.monotonic()
+        self.assertEqual(
+            Response.OK, self.launcher._LauncherHPC__read_popen_pipes(
+                process, "POST /submit"))
+        # tests: it does not wait for the process to finish
+        self.assertLess(time.monotonic() - started_at, 10)
+        self.assertIsNone(process.poll())
+
+    def test_read_popen_pipes_after_exit(self):
+        """Case: the process finishes without writing the signal.
+        It should stop reading once the process is finished."""
+        process = self.__popen(
+            "print('output')",
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self.assertEqual(
+            Response.OK, self.launcher._LauncherHPC__read_popen_pipes(
+                process, "POST /submit"))
+        self.assertIsNotNone(process.returncode)
+
+
+if __name__ == "__main__":
+    unittest.main()